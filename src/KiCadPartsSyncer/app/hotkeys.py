@@ -1,6 +1,7 @@
 # src/companion/app/hotkeys.py
 from __future__ import annotations
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 
 from ..infrastructure.system.win_hotkey import (
@@ -11,10 +12,13 @@ from ..infrastructure.system.win_hotkey import (
 from ..infrastructure.system.logger import Logger
 from ..ui.overlay import Overlay
 
+# Delay before hotkey registration runs on the event loop.
+_REGISTER_DELAY_MS = 50
+
 
 def install_global_hotkeys(app: QApplication, overlay: Overlay, log: Logger) -> None:
     """
-    Register process-wide hotkeys.
+    Register process-wide hotkeys (deferred onto the Qt event loop).
 
     Currently:
       - Ctrl+` toggles HUD click-through ONLY when the HUD is visible.
@@ -29,38 +33,44 @@ def install_global_hotkeys(app: QApplication, overlay: Overlay, log: Logger) ->
                 return
 
             # Toggle click-through.
-            overlay.set_click_through(not overlay.is_click_through())
+            enabled = not overlay.is_click_through()
+            overlay.set_click_through(enabled)
 
             # If something during toggle caused it to vanish/minimize, restore it.
-            if not overlay.isVisible():
+            visible = overlay.isVisible()
+            if not visible:
                 show_overlay = getattr(overlay, "show_overlay", None)
                 if callable(show_overlay):
                     show_overlay()
                 else:
                     overlay.show()
+                visible = overlay.isVisible()
 
-            state = "on" if overlay.is_click_through() else "off"
             log.info(
                 "hotkey",
                 "click_through_toggled",
                 {
-                    "state": state,
-                    "visible": overlay.isVisible(),
+                    "state": "on" if enabled else "off",
+                    "visible": visible,
                 },
             )
         except Exception as ex:
             log.error("hotkey", "click_through_failed", {"err": repr(ex)})
 
-    try:
-        hk = WinHotkeyManager(app)
-        ok = hk.register(
-            id=1,
-            modifiers=MOD_CONTROL,
-            vk=VK_OEM_3,
-            callback=_toggle_click_through,
-        )
-        if not ok:
-            log.error("hotkey", "registration_failed", {"combo": "Ctrl+`"})
-    except Exception as ex:
-        # Non-Windows or unexpected failure; app still runs without the global hotkey.
-        log.error("hotkey", "manager_init_failed", {"err": repr(ex)})
+    def _do_register() -> None:
+        try:
+            hk = WinHotkeyManager(app)
+            ok = hk.register(
+                id=1,
+                modifiers=MOD_CONTROL,
+                vk=VK_OEM_3,
+                callback=_toggle_click_through,
+            )
+            if not ok:
+                log.error("hotkey", "registration_failed", {"combo": "Ctrl+`"})
+        except Exception as ex:
+            # Non-Windows or unexpected failure; app still runs without the global hotkey.
+            log.error("hotkey", "manager_init_failed", {"err": repr(ex)})
+
+    # Deferred so app.exec() (and first paint) isn't held up by hotkey setup.
+    QTimer.singleShot(_REGISTER_DELAY_MS, _do_register)
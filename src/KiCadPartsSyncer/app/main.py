@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import sys
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 
 # ---- infrastructure ----
@@ -30,15 +31,26 @@ from .orchestrator import Orchestrator
 from .hotkeys import install_global_hotkeys
 
 
+class _ServiceBag(object):
+    """Tiny service bag handed to Orchestrator."""
+
+    __slots__ = ("app", "log", "hub", "endpoint", "overlay", "tray")
+
+
+def _noop(_evt) -> None:
+    pass
+
+
+def _bind(obj, name: str):
+    """Return obj.<name> if the handler exists, else a shared no-op."""
+    return getattr(obj, name, _noop)
+
+
 def _qt_bootstrap(app: QApplication) -> None:
     app.setQuitOnLastWindowClosed(False)
 
-    # High-DPI awareness (best-effort on Windows)
-    try:
-        import ctypes
-        ctypes.windll.shcore.SetProcessDpiAwareness(2)
-    except Exception:
-        pass
+    # High-DPI: Qt 6 already makes the process per-monitor-v2 DPI aware
+    # before QApplication is constructed, so there is nothing to set here.
 
 
 def main() -> int:
@@ -63,47 +75,66 @@ def main() -> int:
         except Exception:
             pass
 
-    # ---- tray ----
-    # IMPORTANT: ensure this matches your actual Tray.__init__ signature.
-    # If Tray(app, overlay, hub) is your current definition, this is correct.
-    # If it still expects (app, overlay, settings, hub), wire settings here explicitly.
-    tray = Tray(app, overlay, hub)
-
     # ---- tiny service bag for Orchestrator ----
-    class _Sv(object):
-        pass
-
-    sv = _Sv()
+    sv = _ServiceBag()
     sv.app = app
     sv.log = log
     sv.hub = hub
     sv.endpoint = endpoint
     sv.overlay = overlay
-    sv.tray = tray
-
-    # ---- orchestrator wiring ----
-    orch = Orchestrator(sv)
 
-    hub.subscribe(EndpointAppeared, orch.on_endpoint_appeared)
-    hub.subscribe(EndpointVanished, orch.on_endpoint_vanished)
-    hub.subscribe(ConnectedToKiCad, orch.on_connected)
-    hub.subscribe(DisconnectedFromKiCad, orch.on_disconnected)
-    hub.subscribe(RemoteUpdatesFound, getattr(orch, "on_remote_updates", lambda e: None))
-    hub.subscribe(LocalChangesFound, getattr(orch, "on_local_changes", lambda e: None))
-    hub.subscribe(NewLibraryDiscovered, getattr(orch, "on_new_library", lambda e: None))
-    hub.subscribe(FreezeToggled, orch.on_freeze_toggled)
+    # The remaining setup is chained through the event loop, one stage per
+    # turn, so Qt can flush pending paint events between init slabs instead
+    # of blocking first paint on the whole sequence.
 
-    # Ensure dormant at boot; EndpointDetector will drive transitions.
-    try:
-        orch.enter_dormant()
-    except Exception:
-        pass
+    def _stage_tray() -> None:
+        # ---- tray ----
+        try:
+            sv.tray = Tray(app, overlay, hub)
+        except Exception as ex:
+            sv.tray = None
+            log.error("startup", "tray_init_failed", {"err": repr(ex)})
+        QTimer.singleShot(0, _stage_orchestrator)
+
+    def _stage_orchestrator() -> None:
+        # ---- orchestrator wiring ----
+        try:
+            orch = Orchestrator(sv)
+
+            hub.subscribe_many([
+                (EndpointAppeared, orch.on_endpoint_appeared),
+                (EndpointVanished, orch.on_endpoint_vanished),
+                (ConnectedToKiCad, orch.on_connected),
+                (DisconnectedFromKiCad, orch.on_disconnected),
+                (RemoteUpdatesFound, _bind(orch, "on_remote_updates")),
+                (LocalChangesFound, _bind(orch, "on_local_changes")),
+                (NewLibraryDiscovered, _bind(orch, "on_new_library")),
+                (FreezeToggled, orch.on_freeze_toggled),
+            ])
+
+            # Ensure dormant at boot; EndpointDetector will drive transitions.
+            try:
+                orch.enter_dormant()
+            except Exception:
+                pass
+        except Exception as ex:
+            log.error("startup", "orchestrator_init_failed", {"err": repr(ex)})
+        QTimer.singleShot(0, _stage_run)
+
+    def _stage_run() -> None:
+        # ---- global hotkeys ----
+        try:
+            install_global_hotkeys(app, overlay, log)
+        except Exception as ex:
+            log.error("startup", "hotkeys_install_failed", {"err": repr(ex)})
 
-    # ---- global hotkeys ----
-    install_global_hotkeys(app, overlay, log)
+        # ---- run ----
+        try:
+            endpoint.start()
+        except Exception as ex:
+            log.error("startup", "endpoint_start_failed", {"err": repr(ex)})
 
-    # ---- run ----
-    endpoint.start()
+    QTimer.singleShot(0, _stage_tray)
     return app.exec()
 
 
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import threading
-
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal, Slot
 from PySide6.QtWidgets import QMessageBox
 
 from ..domain.events import (
@@ -17,26 +15,61 @@ from KiCadPartsSyncer.infrastructure.git.repo_status_poller import RepoStatusPol
 from KiCadPartsSyncer.infrastructure.git import repo_puller, repo_pusher
 
 
+# Per-op dialog titles and log prefix: op -> (title_ok, title_err, log_prefix)
+_OP_META = {
+    "pull": ("KiCad Libraries Updated", "KiCad Library Pull Failed", "repo_pull"),
+    "push": ("KiCad Libraries Pushed", "KiCad Library Push Failed", "repo_push"),
+}
+
+
 class _GitOpResultDispatcher(QObject):
     """
     Lives on the GUI thread.
 
     Worker thread emits sig_show(op, success, message), Qt delivers it
-    to _on_show on the GUI thread (QueuedConnection by default).
+    to _on_show on the GUI thread. Emitters are always pool workers, so the
+    connection is explicitly queued rather than resolved per emit.
+
+    The repo status poller thread emits sig_repo_status(status) the same
+    way, so status bookkeeping only ever happens on the GUI thread.
     """
 
     sig_show = Signal(str, bool, str)  # op, success, message
+    sig_repo_status = Signal(str)      # status
 
     def __init__(self, orchestrator: "Orchestrator") -> None:
         QObject.__init__(self)
         self._orchestrator = orchestrator
-        self.sig_show.connect(self._on_show)
+        self.sig_show.connect(self._on_show, Qt.QueuedConnection)
+        self.sig_repo_status.connect(self._on_repo_status, Qt.QueuedConnection)
 
     @Slot(str, bool, str)
     def _on_show(self, op: str, success: bool, message: str) -> None:
         # Delegate to Orchestrator's GUI-thread handler.
         self._orchestrator._show_git_result(op, success, message)
 
+    @Slot(str)
+    def _on_repo_status(self, status: str) -> None:
+        self._orchestrator._on_repo_status(status)
+
+
+class _GitRunnable(QRunnable):
+    """
+    Pool task wrapping a single git operation.
+
+    run() executes on a QThreadPool worker and hands off to
+    Orchestrator._run_git_worker, which emits the result via the dispatcher.
+    """
+
+    def __init__(self, orchestrator: "Orchestrator", op: str, func) -> None:
+        QRunnable.__init__(self)
+        self._orchestrator = orchestrator
+        self._op = op
+        self._func = func
+
+    def run(self) -> None:
+        self._orchestrator._run_git_worker(self._op, self._func)
+
 
 class Orchestrator:
     """
@@ -51,8 +84,11 @@ class Orchestrator:
 
     def __init__(self, sv):
         self.sv = sv
+        self._log_info = sv.log.info
+        self._log_error = sv.log.error
         self._connected = False      # logical "ConnectedToKiCad" state
         self._frozen = False
+        self._last_status = None     # last repo status pushed to the overlay
 
         # Track in-progress git operations by name ("pull", "push")
         self._op_in_progress = {
@@ -64,76 +100,59 @@ class Orchestrator:
         # so its slot will always run on GUI thread.
         self._git_dispatcher = _GitOpResultDispatcher(self)
 
+        # Persistent worker pool for git operations: one slot per op, so
+        # repeated Pull/Push clicks reuse threads instead of spawning new ones.
+        self._git_pool = QThreadPool()
+        self._git_pool.setMaxThreadCount(len(self._op_in_progress))
+
         # Prepare poller; do NOT start yet.
         try:
-            self._repo_poller = RepoStatusPoller(self._on_repo_status)
+            # The poller calls back on its own thread; hop to the GUI thread.
+            self._repo_poller = RepoStatusPoller(
+                self._git_dispatcher.sig_repo_status.emit
+            )
         except Exception:
             self._repo_poller = None
-            try:
-                self.sv.log.info(
-                    "repo_status",
-                    "poller_init_failed",
-                    {"reason": "exception_during_init"},
-                )
-            except Exception:
-                pass
+            self._log_info(
+                "repo_status",
+                "poller_init_failed",
+                {"reason": "exception_during_init"},
+            )
 
         # Wire "Pull" button intent from overlay -> orchestrator.
         try:
             # Overlay must define: _sig_pull_requested = Signal()
             self.sv.overlay._sig_pull_requested.connect(self._on_pull_requested)
-            self.sv.log.info(
-                "repo_pull",
-                "pull_signal_connected",
-                {},
-            )
+            self._log_info("repo_pull", "pull_signal_connected", {})
         except Exception:
-            try:
-                self.sv.log.info(
-                    "repo_pull",
-                    "pull_signal_connect_failed",
-                    {},
-                )
-            except Exception:
-                pass
+            self._log_info("repo_pull", "pull_signal_connect_failed", {})
 
         # Wire "Push" button intent from overlay -> orchestrator.
         try:
             # Overlay must define: _sig_push_requested = Signal()
             self.sv.overlay._sig_push_requested.connect(self._on_push_requested)
-            self.sv.log.info(
-                "repo_push",
-                "push_signal_connected",
-                {},
-            )
+            self._log_info("repo_push", "push_signal_connected", {})
         except Exception:
-            try:
-                self.sv.log.info(
-                    "repo_push",
-                    "push_signal_connect_failed",
-                    {},
-                )
-            except Exception:
-                pass
+            self._log_info("repo_push", "push_signal_connect_failed", {})
 
-    # ---------- repo status handling (callback from background thread) ----------
+    # ---------- repo status handling (GUI thread) ----------
 
     def _on_repo_status(self, status: str) -> None:
         """
-        Called from RepoStatusPoller background thread.
+        Runs on the GUI thread: queued from the RepoStatusPoller thread via
+        the dispatcher, or called directly when a freeze is lifted.
         """
-        try:
-            self.sv.log.info("repo_status", "update", {"status": status})
-        except Exception:
-            pass
-
-        if self._frozen:
+        # Frozen HUD ignores updates; unchanged status needs no log or repaint.
+        if self._frozen or status == self._last_status:
             return
 
+        self._log_info("repo_status", "update", {"status": status})
+
         try:
             self.sv.overlay.set_repo_status(status)
+            self._last_status = status
         except Exception:
-            # Never let UI issues propagate back into the poller thread.
+            # Never let UI issues escape into the event loop.
             pass
 
     def _start_repo_poller(self) -> None:
@@ -141,99 +160,54 @@ class Orchestrator:
             return
         try:
             self._repo_poller.start()
-            self.sv.log.info("repo_status", "poller_started", {})
+            self._log_info("repo_status", "poller_started", {})
         except Exception:
-            try:
-                self.sv.log.info("repo_status", "poller_start_failed", {})
-            except Exception:
-                pass
+            self._log_info("repo_status", "poller_start_failed", {})
 
     def _stop_repo_poller(self) -> None:
         if self._repo_poller is None:
             return
         try:
             self._repo_poller.stop()
-            self.sv.log.info("repo_status", "poller_stopped", {})
+            self._log_info("repo_status", "poller_stopped", {})
         except Exception:
             pass
 
     # ---------- generic git op pipeline (pull/push) ----------
 
-    def _start_git_op(self, op: str, func, thread_name: str) -> None:
+    def _start_git_op(self, op: str, func) -> None:
         """
         Shared entry point for git operations.
 
         op: "pull" or "push"
         func: callable returning (success: bool, message: str)
-        thread_name: name for the worker thread
         """
+        log_prefix = "repo_{0}".format(op)
+
         if self._op_in_progress.get(op, False):
-            try:
-                self.sv.log.info(
-                    "repo_{0}".format(op),
-                    "ignored_already_in_progress",
-                    {},
-                )
-            except Exception:
-                pass
+            self._log_info(log_prefix, "ignored_already_in_progress", {})
             return
 
         self._op_in_progress[op] = True
+        self._log_info(log_prefix, "requested", {})
 
-        try:
-            self.sv.log.info(
-                "repo_{0}".format(op),
-                "requested",
-                {},
-            )
-        except Exception:
-            pass
-
-        t = threading.Thread(
-            target=self._run_git_worker,
-            name=thread_name,
-            daemon=True,
-            args=(op, func),
-        )
-        t.start()
+        self._git_pool.start(_GitRunnable(self, op, func))
 
     def _run_git_worker(self, op: str, func) -> None:
         """
-        Background-thread body: call func() and emit result via dispatcher
+        Worker-thread body: call func() and emit result via dispatcher
         (Qt will deliver on GUI thread).
         """
-        try:
-            try:
-                self.sv.log.info(
-                    "repo_{0}".format(op),
-                    "worker_start",
-                    {},
-                )
-            except Exception:
-                pass
+        log_prefix = "repo_{0}".format(op)
 
+        try:
+            self._log_info(log_prefix, "worker_start", {})
             success, message = func()
-
-            try:
-                self.sv.log.info(
-                    "repo_{0}".format(op),
-                    "worker_done",
-                    {"success": bool(success)},
-                )
-            except Exception:
-                pass
-
+            self._log_info(log_prefix, "worker_done", {"success": bool(success)})
         except Exception as exc:
             success = False
-            message = "Unexpected error in repo_{0}: {1}".format(op, exc)
-            try:
-                self.sv.log.error(
-                    "repo_{0}".format(op),
-                    "worker_exception",
-                    {"error": str(exc)},
-                )
-            except Exception:
-                pass
+            message = "Unexpected error in {0}: {1}".format(log_prefix, exc)
+            self._log_error(log_prefix, "worker_exception", {"error": str(exc)})
 
         # Emit to dispatcher; Qt queues this to GUI thread.
         try:
@@ -241,84 +215,33 @@ class Orchestrator:
         except Exception:
             # In absolute worst case, if dispatcher fails, at least unlock.
             self._op_in_progress[op] = False
-            try:
-                self.sv.log.error(
-                    "repo_{0}".format(op),
-                    "dispatcher_emit_failed",
-                    {},
-                )
-            except Exception:
-                pass
+            self._log_error(log_prefix, "dispatcher_emit_failed", {})
 
     def _show_git_result(self, op: str, success: bool, message: str) -> None:
         """
         Runs on the GUI thread. Shows dialog and clears in-progress flag.
         """
-        # Titles & log prefixes per operation
         op = (op or "").strip().lower()
-        if op not in ("pull", "push"):
+        if op not in _OP_META:
             op = "pull"  # fallback
-
-        if op == "pull":
-            title_ok = "KiCad Libraries Updated"
-            title_err = "KiCad Library Pull Failed"
-        else:
-            title_ok = "KiCad Libraries Pushed"
-            title_err = "KiCad Library Push Failed"
-
-        log_prefix = "repo_{0}".format(op)
+        title_ok, title_err, log_prefix = _OP_META[op]
 
         try:
             if success:
                 try:
-                    QMessageBox.information(
-                        self.sv.overlay,
-                        title_ok,
-                        message,
-                    )
+                    QMessageBox.information(self.sv.overlay, title_ok, message)
                 except Exception:
-                    try:
-                        self.sv.log.info(
-                            log_prefix,
-                            "succeeded_no_dialog",
-                            {},
-                        )
-                    except Exception:
-                        pass
-
-                try:
-                    self.sv.log.info(
-                        log_prefix,
-                        "succeeded",
-                        {},
-                    )
-                except Exception:
-                    pass
+                    self._log_info(log_prefix, "succeeded_no_dialog", {})
+                self._log_info(log_prefix, "succeeded", {})
+                # The remote or local branch just moved; re-check right away.
+                if self._repo_poller is not None:
+                    self._repo_poller.reset_circuit()
             else:
                 try:
-                    QMessageBox.critical(
-                        self.sv.overlay,
-                        title_err,
-                        message,
-                    )
-                except Exception:
-                    try:
-                        self.sv.log.error(
-                            log_prefix,
-                            "failed_no_dialog",
-                            {"message": message},
-                        )
-                    except Exception:
-                        pass
-
-                try:
-                    self.sv.log.error(
-                        log_prefix,
-                        "failed",
-                        {"message": message},
-                    )
+                    QMessageBox.critical(self.sv.overlay, title_err, message)
                 except Exception:
-                    pass
+                    self._log_error(log_prefix, "failed_no_dialog", {"message": message})
+                self._log_error(log_prefix, "failed", {"message": message})
         finally:
             self._op_in_progress[op] = False
 
@@ -331,7 +254,6 @@ class Orchestrator:
         self._start_git_op(
             op="pull",
             func=repo_puller.pull_once,
-            thread_name="RepoPullerThread",
         )
 
     def _on_push_requested(self) -> None:
@@ -341,7 +263,6 @@ class Orchestrator:
         self._start_git_op(
             op="push",
             func=repo_pusher.push_once,
-            thread_name="RepoPusherThread",
         )
 
     # ---------- event handlers ----------
@@ -350,7 +271,7 @@ class Orchestrator:
         """
         KiCad endpoint detected => HUD active + start repo polling.
         """
-        self.sv.log.info(
+        self._log_info(
             "state",
             "endpoint_appeared",
             {"path": getattr(evt, "path", None)},
@@ -360,7 +281,7 @@ class Orchestrator:
             self.enter_active_monitoring()
             self._start_repo_poller()
         else:
-            self.sv.log.info(
+            self._log_info(
                 "state",
                 "endpoint_appeared_ignored_frozen",
                 {},
@@ -370,7 +291,7 @@ class Orchestrator:
         """
         KiCad endpoint gone => stop polling + HUD dormant.
         """
-        self.sv.log.info("state", "endpoint_vanished", {})
+        self._log_info("state", "endpoint_vanished", {})
         self._stop_repo_poller()
         self.enter_dormant()
 
@@ -383,7 +304,7 @@ class Orchestrator:
         self._connected = True
         project_info = getattr(evt, "project_info", None)
 
-        self.sv.log.info(
+        self._log_info(
             "state",
             "connected",
             {"project_info": project_info},
@@ -392,7 +313,7 @@ class Orchestrator:
         if not self._frozen:
             self.sv.overlay.show_overlay(project_info)
         else:
-            self.sv.log.info(
+            self._log_info(
                 "state",
                 "connected_ignored_frozen",
                 {},
@@ -403,7 +324,7 @@ class Orchestrator:
         Logical disconnect; endpoint events will still govern polling.
         """
         self._connected = False
-        self.sv.log.info("state", "disconnected", {})
+        self._log_info("state", "disconnected", {})
         # Don't touch poller here; endpoint_vanished handles that.
         self.enter_dormant()
 
@@ -412,7 +333,7 @@ class Orchestrator:
         Freeze = stop reacting visually (including repo status color changes).
         """
         self._frozen = bool(evt.is_frozen)
-        self.sv.log.info(
+        self._log_info(
             "state",
             "freeze_toggled",
             {"is_frozen": self._frozen},
@@ -433,14 +354,18 @@ class Orchestrator:
         else:
             self.enter_dormant()
 
+        # Catch up on any status the poller reported while frozen.
+        if self._repo_poller is not None and self._repo_poller.last_status:
+            self._on_repo_status(self._repo_poller.last_status)
+
     # ---------- states ----------
 
     def enter_active_monitoring(self):
-        self.sv.log.info("state", "enter_active_monitoring", {})
+        self._log_info("state", "enter_active_monitoring", {})
         self.sv.overlay.show_overlay()
 
     def enter_dormant(self):
-        self.sv.log.info("state", "enter_dormant", {})
+        self._log_info("state", "enter_dormant", {})
         self.sv.overlay.hide_overlay()
 
     # ---------- optional graceful shutdown ----------
@@ -1,37 +1,37 @@
 
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EndpointAppeared:
     path: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EndpointVanished:
     pass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConnectedToKiCad:
     project_info: dict
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DisconnectedFromKiCad:
     pass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RemoteUpdatesFound:
     repo: str
     repo_status: "RepoStatus"  # forward ref
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LocalChangesFound:
     repo: str
     details: dict
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NewLibraryDiscovered:
     folder: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FreezeToggled:
     is_frozen: bool
 
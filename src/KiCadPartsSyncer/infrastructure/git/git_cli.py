@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import os
+import re
+import shutil
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# Parallel fetch (`git fetch --jobs=N`) needs Git 2.8+
+PARALLEL_FETCH_MIN_VERSION = (2, 8)
+PARALLEL_FETCH_JOBS = 8
+
+# A single status check (fetch included) taking longer than this => 'unknown';
+# network git calls made by the check are killed after the same time.
+CHECK_TIMEOUT_SECONDS = 60
+
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)")
+
+
+def hidden_window_kwargs() -> Dict[str, Any]:
+    """
+    Extra subprocess kwargs for background git/python launches.
+
+    On Windows: no console window (so no conhost.exe per spawn). Empty
+    elsewhere. close_fds is left at its default: git processes are spawned
+    from several threads at once, and inheritable pipe ends must not leak
+    into a long-lived child such as `cat-file --batch-check`.
+    """
+    if os.name != "nt":
+        return {}
+
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    startupinfo.wShowWindow = subprocess.SW_HIDE
+    return {
+        "creationflags": subprocess.CREATE_NO_WINDOW,
+        "startupinfo": startupinfo,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def git_env() -> Dict[str, str]:
+    """
+    Environment for git subprocesses, copied from os.environ once per process.
+
+    Everything is kept (git, ssh, credential helpers and TLS may need any of
+    it), and GIT_TERMINAL_PROMPT=0 keeps a background git from waiting on a
+    terminal prompt. Callers must not mutate it.
+    """
+    env = dict(os.environ)
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    return env
+
+
+@functools.lru_cache(maxsize=None)
+def git_executable() -> str:
+    """
+    Absolute path of the git on PATH, resolved once per process so each
+    spawn skips the PATH search. Falls back to plain "git".
+    """
+    return shutil.which("git") or "git"
+
+
+def refresh_git_path() -> None:
+    """Forget the resolved git path, version and env, e.g. after PATH changes."""
+    git_executable.cache_clear()
+    git_env.cache_clear()
+    git_version.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def git_version() -> Tuple[int, int]:
+    """
+    Return the (major, minor) version of the git on PATH.
+
+    Runs `git --version` once per process; (0, 0) if git is missing or the
+    output can't be parsed.
+    """
+    try:
+        out = subprocess.run(
+            [git_executable(), "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=10,
+            **hidden_window_kwargs(),
+        ).stdout
+    except Exception:
+        return (0, 0)
+
+    m = _VERSION_RE.search(out or "")
+    if not m:
+        return (0, 0)
+    return int(m.group(1)), int(m.group(2))
+
+
+def supports_parallel_fetch() -> bool:
+    return git_version() >= PARALLEL_FETCH_MIN_VERSION
+
+
+def run_git(
+    repo_path, args: List[str], op: str, timeout: float
+) -> Tuple[Optional[subprocess.CompletedProcess], str]:
+    """
+    Run `git -C <repo_path> <args...>` once, capturing output as bytes.
+
+    Uses the cached git path and environment and hides the console window.
+    `op` ("pull", "push", ...) only appears in error messages.
+
+    Returns (proc, "") on completion (any exit code), or (None, message)
+    if the process could not be run at all. proc.args is the full command.
+    """
+    cmd = [git_executable(), "-C", str(repo_path)] + list(args)
+    try:
+        proc = subprocess.run(
+            cmd,
+            capture_output=True,
+            env=git_env(),
+            timeout=timeout,
+            **hidden_window_kwargs(),
+        )
+    except subprocess.TimeoutExpired:
+        return None, (
+            f"Timed out while running 'git {op}'.\n\n"
+            "This usually means the remote is unreachable or Git is "
+            "waiting for credentials.\n"
+            "Please verify your network and stored credentials, then try again."
+        )
+    except FileNotFoundError:
+        return None, "Git executable not found. Please install Git and try again."
+    except Exception as exc:
+        return None, f"Unexpected error while running git {op}: {exc}"
+
+    return proc, ""
+
+
+def decode_output(data: Optional[bytes]) -> str:
+    """Captured git output as stripped text (invalid UTF-8 replaced)."""
+    return (data or b"").decode("utf-8", "replace").strip()
+
+
+class CatFileBatch(object):
+    """
+    Long-lived `git cat-file --batch-check` client for one repository.
+
+    Resolves revision expressions (refs, 'HEAD', 'origin/main', ...) to
+    object names over a single persistent process instead of spawning git
+    per lookup. Thread-safe; the process is (re)started lazily.
+    """
+
+    def __init__(self, repo_path: str) -> None:
+        self._repo_path = str(repo_path)
+        self._proc = None  # type: Optional[subprocess.Popen]
+        self._lock = threading.Lock()
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Return the object name for rev, or None if it doesn't exist."""
+        with self._lock:
+            for _ in range(2):  # one retry if the process died under us
+                proc = self._ensure_started()
+                try:
+                    proc.stdin.write(rev + "\n")
+                    proc.stdin.flush()
+                    line = proc.stdout.readline()
+                except (OSError, ValueError):
+                    line = ""
+                if line:
+                    line = line.strip()
+                    if line.endswith(" missing") or line.endswith(" ambiguous"):
+                        return None
+                    return line
+                self._close_locked()
+            return None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                [
+                    git_executable(),
+                    "-C",
+                    self._repo_path,
+                    "cat-file",
+                    "--batch-check=%(objectname)",
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+                **hidden_window_kwargs(),
+            )
+        return self._proc
+
+    def _close_locked(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
+
+
+_cat_file_batches = {}  # type: Dict[str, CatFileBatch]
+_cat_file_batches_lock = threading.Lock()
+
+
+def cat_file_batch(repo_path: str) -> CatFileBatch:
+    """Return the shared CatFileBatch for repo_path (created on first use)."""
+    key = str(repo_path)
+    with _cat_file_batches_lock:
+        batch = _cat_file_batches.get(key)
+        if batch is None:
+            batch = _cat_file_batches[key] = CatFileBatch(key)
+        return batch
+
+
+@atexit.register
+def _close_cat_file_batches() -> None:
+    with _cat_file_batches_lock:
+        for batch in _cat_file_batches.values():
+            batch.close()
+        _cat_file_batches.clear()
@@ -1,17 +1,37 @@
 from __future__ import annotations
 
-import os
 import subprocess
 from typing import Tuple
 
 from ..system import config
+from .git_cli import decode_output, run_git
 
 GIT_PULL_TIMEOUT_SECONDS = 30  # so HUD can't get stuck forever
 
 
+def _failure(proc: subprocess.CompletedProcess) -> Tuple[bool, str]:
+    # Output is only decoded on this failure path.
+    stdout = decode_output(proc.stdout)
+    stderr = decode_output(proc.stderr)
+
+    if stderr and stdout:
+        detail = stderr + "\n\n" + stdout
+    else:
+        detail = stderr or stdout or "Unknown git error."
+
+    cmd = " ".join(proc.args)
+    return False, f"Failed to pull from remote.\n\nCommand: {cmd}\n\n{detail}"
+
+
 def pull_once() -> Tuple[bool, str]:
     """
-    Perform a single `git pull --ff-only` on the configured repository.
+    Fast-forward the configured repository's current branch from its
+    upstream on the configured remote.
+
+    Runs a single
+      `git -c protocol.version=2 pull --ff-only --no-stat --no-tags <remote>`
+    so fetch and fast-forward share one git invocation and one pack
+    negotiation.
 
     Uses:
       - config.load_settings()
@@ -37,72 +57,39 @@ def pull_once() -> Tuple[bool, str]:
 
     remote_name = config.get_repository_remote_name(settings)
 
-    cmd = [
-        "git",
-        "-C",
-        str(repo_path),
+    # ----- fetch + fast-forward in one invocation -----
+    # No branch argument: pull follows the current branch's configured
+    # upstream. protocol v2 lets the server filter refs during negotiation.
+    # The HUD never needs tags or a diffstat, and --ff-only already refuses
+    # diverged histories, so no separate verify step.
+    args = [
+        "-c",
+        "protocol.version=2",
         "pull",
         "--ff-only",
+        "--no-stat",
+        "--no-tags",
         remote_name,
     ]
 
-    env = os.environ.copy()
-    env.setdefault("GIT_TERMINAL_PROMPT", "0")
+    proc, err = run_git(repo_path, args, "pull", GIT_PULL_TIMEOUT_SECONDS)
+    if proc is None:
+        return False, err
+    if proc.returncode != 0:
+        return _failure(proc)
 
-    try:
-        proc = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding="utf-8",
-            env=env,
-            timeout=GIT_PULL_TIMEOUT_SECONDS,
-        )
-    except subprocess.TimeoutExpired:
-        return (
-            False,
-            (
-                "Timed out while running 'git pull'.\n\n"
-                "This usually means the remote is unreachable or Git is "
-                "waiting for credentials.\n"
-                "Please verify your network and stored credentials, then try again."
-            ),
-        )
-    except FileNotFoundError:
-        return False, "Git executable not found. Please install Git and try again."
-    except Exception as exc:
-        return False, "Unexpected error while running git pull: {0}".format(exc)
-
-    stdout = (proc.stdout or "").strip()
-    stderr = (proc.stderr or "").strip()
-
-    if proc.returncode == 0:
-        combined = (stdout + "\n" + stderr).lower()
-
-        if "already up to date" in combined or "already up-to-date" in combined:
-            return True, (
-                "No changes were pulled.\n\n"
-                "The KiCad libraries are already up to date."
-            )
+    combined = ((proc.stdout or b"") + b"\n" + (proc.stderr or b"")).lower()
 
+    if b"already up to date" in combined or b"already up-to-date" in combined:
         return True, (
-            "Library successfully updated from remote.\n\n"
-            "Changes will take effect after restarting KiCad."
+            "No changes were pulled.\n\n"
+            "The KiCad libraries are already up to date."
         )
 
-    if stderr and stdout:
-        detail = stderr + "\n\n" + stdout
-    else:
-        detail = stderr or stdout or "Unknown git error."
-
-    msg = (
-        "Failed to pull from remote.\n\n"
-        "Command: {cmd}\n\n"
-        "{detail}"
-    ).format(cmd=" ".join(cmd), detail=detail)
-
-    return False, msg
+    return True, (
+        "Library successfully updated from remote.\n\n"
+        "Changes will take effect after restarting KiCad."
+    )
 
 
 if __name__ == "__main__":
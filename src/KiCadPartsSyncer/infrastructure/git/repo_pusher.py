@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import os
-import subprocess
 from typing import Tuple
 
 from ..system import config
+from .git_cli import decode_output, run_git
 
 GIT_PUSH_TIMEOUT_SECONDS = 30  # keep it short so HUD can't hang forever
 
@@ -37,38 +36,19 @@ def push_once() -> Tuple[bool, str]:
 
     remote_name = config.get_repository_remote_name(settings)
 
-    cmd = [
-        "git",
-        "-C",
-        str(repo_path),
-        "push",
-        remote_name,
-    ]
+    proc, err = run_git(
+        repo_path, ["push", remote_name], "push", GIT_PUSH_TIMEOUT_SECONDS
+    )
+    if proc is None:
+        return False, err
 
-    env = os.environ.copy()
-    env.setdefault("GIT_TERMINAL_PROMPT", "0")
-
-    try:
-        proc = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=env,
-            timeout=GIT_PUSH_TIMEOUT_SECONDS,
-            text=True,
-        )
-    except subprocess.TimeoutExpired:
-        return False, "git push timed out after {0} seconds".format(
-            GIT_PUSH_TIMEOUT_SECONDS
-        )
+    stdout = decode_output(proc.stdout)
 
     if proc.returncode != 0:
-        stderr = (proc.stderr or "").strip()
-        stdout = (proc.stdout or "").strip()
+        stderr = decode_output(proc.stderr)
         msg = stderr or stdout or "git push failed with unknown error."
         return False, msg
 
-    stdout = (proc.stdout or "").strip()
     if not stdout:
         stdout = "git push completed successfully."
 
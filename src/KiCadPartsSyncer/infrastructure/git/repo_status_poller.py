@@ -1,41 +1,120 @@
 from __future__ import annotations
 
+import json
 import sys
 import time
 import threading
 import subprocess
-from typing import Callable, Optional
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
-from ..system.config import get_repo_poll_interval_seconds
+from ..system.config import (
+    load_settings,
+    get_repository_local_path,
+    get_repo_poll_interval_seconds,
+    get_repo_status_in_process,
+    MAX_REPO_POLL_INTERVAL_SECONDS,
+)
+from .git_cli import CHECK_TIMEOUT_SECONDS, cat_file_batch, hidden_window_kwargs
 
 # repo_status_poller.py is at: src/KiCadPartsSyncer/infrastructure/git/
 # We want cwd=src so that `-m KiCadPartsSyncer....` works.
 SRC_ROOT = Path(__file__).resolve().parents[3]
 
+# Consecutive 'unknown' results before the poller starts backing off.
+CIRCUIT_FAILURE_THRESHOLD = 3
+
+# A check that took N seconds schedules the next one no sooner than this
+# multiple of N after it (slow remote => poll less often).
+SLOW_CHECK_BACKOFF_FACTOR = 1.5
+
+# Last status per repository path, kept across runs:
+#   {repo_path: {"status": ..., "refs": [HEAD sha, @{u} sha], "time": epoch}}
+_STATUS_CACHE_PATH = Path.home() / ".cache" / "KiCadPartsSyncer" / "repo_status.json"
+
+
+def _load_status_cache() -> Dict[str, Any]:
+    try:
+        with _STATUS_CACHE_PATH.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_status_cache(cache: Dict[str, Any]) -> None:
+    try:
+        _STATUS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with _STATUS_CACHE_PATH.open("w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except Exception:
+        pass
+
+
+def _refs_stamp(repo_path: str) -> Optional[List[Optional[str]]]:
+    """[HEAD sha, upstream sha] via the shared cat-file process; None on error."""
+    try:
+        batch = cat_file_batch(repo_path)
+        return [batch.resolve("HEAD"), batch.resolve("@{u}")]
+    except Exception:
+        return None
+
 
 class RepoStatusPoller(object):
     """
     Periodically runs `KiCadPartsSyncer.infrastructure.git.remote_checker`
-    and reports a normalized status string via a callback:
+    (in-process by default, or as a `python -m` subprocess when
+    repoStatusInProcess is false) and reports a normalized status string
+    via a callback:
 
         'unknown'  -> not configured / cannot check / error
         'clean'    -> repo in sync with remote
         'diverged' -> local and/or remote is ahead / diverged / detached
 
+    Scheduling:
+      - Healthy: every max(interval, 1.5 x last check duration).
+      - The last result is persisted per repository. On start() it is
+        reported immediately, and a check is skipped (cached result
+        reported) while HEAD and its upstream are unchanged and the result
+        is younger than the interval.
+      - After CIRCUIT_FAILURE_THRESHOLD consecutive 'unknown' results the
+        circuit opens: each further failure doubles the wait, up to
+        MAX_REPO_POLL_INTERVAL_SECONDS. The first success, or
+        reset_circuit(), restores the base interval.
+
     Responsibilities:
       - Own background thread + interval.
       - Never depend on Qt or UI.
       - Never crash the app on errors.
     """
 
+    __slots__ = (
+        "_on_status",
+        "_base_interval",
+        "_interval",
+        "_fail_count",
+        "_last_status",
+        "_in_process",
+        "_pending",
+        "_stop",
+        "_wake",
+        "_thread",
+    )
+
     def __init__(self, on_status: Callable[[str], None]) -> None:
         if on_status is None:
             raise ValueError("on_status callback must not be None.")
 
         self._on_status = on_status
-        self._interval = get_repo_poll_interval_seconds()
+        self._base_interval = get_repo_poll_interval_seconds()
+        self._interval = self._base_interval
+        self._fail_count = 0
+        self._last_status = None  # type: Optional[str]
+        self._in_process = get_repo_status_in_process()
+        self._pending = None  # type: Optional[Future]
         self._stop = threading.Event()
+        self._wake = threading.Event()  # set by stop() / reset_circuit()
         self._thread = None  # type: Optional[threading.Thread]
 
     # ---------- lifecycle ----------
@@ -51,6 +130,7 @@ class RepoStatusPoller(object):
             return
 
         self._stop.clear()
+        self._wake.clear()
         self._thread = threading.Thread(
             target=self._run_loop,
             name="RepoStatusPoller",
@@ -65,34 +145,155 @@ class RepoStatusPoller(object):
         A future start() call will spin up a fresh thread.
         """
         self._stop.set()
+        self._wake.set()
+
+    @property
+    def last_status(self) -> Optional[str]:
+        """Most recently reported status (None before the first report)."""
+        return self._last_status
+
+    def reset_circuit(self) -> None:
+        """
+        Forget past failures, restore the base interval and check now.
+
+        Intended for external "the remote may have changed" triggers
+        (e.g. after a successful pull/push). Harmless if not running.
+        """
+        self._fail_count = 0
+        self._interval = self._base_interval
+        self._wake.set()
 
     # ---------- internals ----------
 
     def _run_loop(self) -> None:
-        # Initial notification so consumers have a known starting point.
-        self._safe_report("unknown")
+        # Stale-while-revalidate: report the last known status right away
+        # (from this process, else from a previous run), then refresh it.
+        status = self._last_status
+        if status is None:
+            repo_path = self._repo_path()
+            entry = _load_status_cache().get(repo_path) if repo_path else None
+            status = entry["status"] if isinstance(entry, dict) else "unknown"
+        self._safe_report(status)
 
         while not self._stop.is_set():
-            status = self._check_once()
+            t0 = time.monotonic()
+            status = self._check_cached()
+            elapsed = time.monotonic() - t0
             self._safe_report(status)
 
-            # Sleep in 1s chunks so stop() is responsive.
-            remaining = self._interval
-            while remaining > 0 and not self._stop.is_set():
-                time.sleep(1.0)
-                remaining -= 1
+            # Wakes immediately on stop() or reset_circuit().
+            self._wake.wait(self._next_interval(status, elapsed))
+            self._wake.clear()
+
+    def _next_interval(self, status: str, elapsed: float) -> float:
+        if status == "unknown":
+            self._fail_count += 1
+            if self._fail_count >= CIRCUIT_FAILURE_THRESHOLD:
+                self._interval = min(self._interval * 2, MAX_REPO_POLL_INTERVAL_SECONDS)
+        else:
+            self._fail_count = 0
+            self._interval = min(
+                max(self._base_interval, int(SLOW_CHECK_BACKOFF_FACTOR * elapsed)),
+                MAX_REPO_POLL_INTERVAL_SECONDS,
+            )
+        return self._interval
 
     def _safe_report(self, status: str) -> None:
         """Invoke the callback; swallow any exceptions."""
+        self._last_status = status
         try:
             self._on_status(status)
         except Exception:
             # Consumer issues must not kill this thread.
             pass
 
+    @staticmethod
+    def _repo_path() -> Optional[str]:
+        try:
+            return str(get_repository_local_path(load_settings()))
+        except RuntimeError:
+            return None
+
+    def _check_cached(self) -> str:
+        """
+        _check_once(), unless the persisted result for this repository is
+        younger than the interval and HEAD/upstream haven't moved since.
+        """
+        repo_path = self._repo_path()
+        if repo_path is None:
+            return self._check_once()
+
+        cache = _load_status_cache()
+        entry = cache.get(repo_path)
+        stamp = _refs_stamp(repo_path)
+        if (
+            isinstance(entry, dict)
+            and stamp is not None
+            and entry.get("refs") == stamp
+            and time.time() - entry.get("time", 0) < self._interval
+        ):
+            return entry["status"]
+
+        status = self._check_once()
+        if status != "unknown":
+            # Stamp after the check: a fetch may have moved the upstream ref.
+            cache[repo_path] = {
+                "status": status,
+                "refs": _refs_stamp(repo_path),
+                "time": time.time(),
+            }
+            _save_status_cache(cache)
+        return status
+
+    def _run_checker(self) -> Tuple[int, str]:
+        """
+        Run remote_checker once; return (exit_code, combined output).
+
+        In-process runs go on a daemon thread so the wait can be abandoned
+        after CHECK_TIMEOUT_SECONDS and a stuck check never blocks
+        interpreter exit (concurrent.futures joins its pool workers there).
+        The checker's network git calls are killed after the same time;
+        until an abandoned check has finished, no new one is started.
+        """
+        if self._in_process:
+            # Imported on first use: it pulls in GitPython.
+            from . import remote_checker
+
+            pending = self._pending
+            if pending is not None and not pending.done():
+                return 1, "[RepoStatusPoller] previous check still running"
+
+            self._pending = future = Future()
+
+            def _work() -> None:
+                future.set_running_or_notify_cancel()
+                try:
+                    future.set_result(remote_checker.check())
+                except BaseException as exc:
+                    future.set_exception(exc)
+
+            threading.Thread(target=_work, name="RemoteChecker", daemon=True).start()
+            return future.result(timeout=CHECK_TIMEOUT_SECONDS)
+
+        cmd = [
+            sys.executable,
+            "-m",
+            "KiCadPartsSyncer.infrastructure.git.remote_checker",
+        ]
+
+        completed = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=CHECK_TIMEOUT_SECONDS,
+            cwd=str(SRC_ROOT),
+            **hidden_window_kwargs(),
+        )
+        return completed.returncode, (completed.stdout or "") + (completed.stderr or "")
+
     def _check_once(self) -> str:
         """
-        Invoke remote_checker via subprocess and interpret its output.
+        Run remote_checker and interpret its output.
 
         Rules:
           - Non-zero exit           -> 'unknown'
@@ -104,24 +305,12 @@ class RepoStatusPoller(object):
           - Otherwise (exit 0)      -> 'clean' (safe fallback)
         """
         try:
-            cmd = [
-                sys.executable,
-                "-m",
-                "KiCadPartsSyncer.infrastructure.git.remote_checker",
-            ]
-
-            completed = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                cwd=str(SRC_ROOT),
-            )
+            returncode, text = self._run_checker()
 
-            if completed.returncode != 0:
+            if returncode != 0:
                 return "unknown"
 
-            text = ((completed.stdout or "") + (completed.stderr or "")).lower()
+            text = text.lower()
 
             # Detached HEAD explicitly => treat as diverged / non-clean.
             if "detached" in text and "head" in text:
@@ -1,19 +1,97 @@
+import operator
+import sys
 import threading
 from typing import Optional
 
 import psutil
 
+# Optional: WMI process start/stop notifications (Windows; pywin32 + wmi).
+try:
+    import pythoncom  # type: ignore
+    import wmi  # type: ignore
+except ImportError:  # pragma: no cover
+    wmi = None
+
 from ...domain.events import EndpointAppeared, EndpointVanished
 
+# Process names we treat as "KiCad is running" (compared lowercased)
+_KICAD_NAMES = frozenset(("kicad.exe", "kicad"))
+
+_get_name = operator.itemgetter("name")
+
+# With both WMI watchers running, a confirmed state is only re-polled this
+# often as a safety net; process start/stop events wake the loop at once.
+WMI_IDLE_RECHECK_SECONDS = 30.0
+_WMI_KINDS = ("Creation", "Deletion")
+
+# ---------- Win32 process snapshot ----------
+# One CreateToolhelp32Snapshot call returns every process name in a single
+# kernel buffer; psutil would build a Process object per PID instead.
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    TH32CS_SNAPPROCESS = 0x00000002
+    _INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    class _PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),  # ULONG_PTR
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * wintypes.MAX_PATH),
+        ]
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _CreateToolhelp32Snapshot = _kernel32.CreateToolhelp32Snapshot
+    _CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    _CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+
+    _Process32FirstW = _kernel32.Process32FirstW
+    _Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+    _Process32FirstW.restype = wintypes.BOOL
+
+    _Process32NextW = _kernel32.Process32NextW
+    _Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+    _Process32NextW.restype = wintypes.BOOL
+
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+else:
+    _kernel32 = None
+
 
 class EndpointDetector:
     """
     Ultra-light KiCad presence detector for Windows.
-    - Polls process list every 1.0s (near-zero CPU)
+    - Polls process list every 1.0s (near-zero CPU); with WMI available,
+      kicad.exe start/stop events drive it and idle polling drops to 30s
+    - Uses a Toolhelp32 snapshot on Windows, psutil elsewhere
     - Publishes EndpointAppeared / EndpointVanished on transitions
     - Debounces flaps (two consecutive identical readings before emitting)
     """
 
+    __slots__ = (
+        "_hub",
+        "_log",
+        "_interval",
+        "_t",
+        "_stop",
+        "_is_up",
+        "_want_state",
+        "_confirm_count",
+        "_wake",
+        "_wmi_live",
+    )
+
     def __init__(self, hub, log, interval: float = 1.0):
         self._hub = hub
         self._log = log
@@ -21,32 +99,47 @@ class EndpointDetector:
 
         self._t: Optional[threading.Thread] = None
         self._stop = threading.Event()
+        self._wake = threading.Event()  # set by stop() and WMI events
+        self._wmi_live = set()  # WMI watcher kinds currently subscribed
         self._is_up = False
         self._want_state = None
         self._confirm_count = 0
 
-        # Process names we treat as "KiCad is running"
-        self._name_candidates = ("kicad.exe", "kicad")
-
     # ---------- lifecycle ----------
     def start(self):
         if self._t and self._t.is_alive():
             return
-        self._stop.clear()
-        self._t = threading.Thread(target=self._run, name="EndpointDetector", daemon=True)
+        # Fresh stop Event and live-set per start: threads from a previous
+        # start (WMI watchers may still be blocked in watcher()) keep their
+        # own, already-set Event and can't touch the new run's state.
+        stop = self._stop = threading.Event()
+        live = self._wmi_live = set()
+        self._wake.clear()
+        self._t = threading.Thread(
+            target=self._run, args=(stop,), name="EndpointDetector", daemon=True
+        )
         self._t.start()
+        if wmi is not None:
+            for kind in _WMI_KINDS:
+                threading.Thread(
+                    target=self._watch_wmi,
+                    args=(kind, stop, live),
+                    name="EndpointDetector-WMI-" + kind,
+                    daemon=True,
+                ).start()
         self._log.info("endpoint", "detector_started", {})
 
     def stop(self):
         self._stop.set()
+        self._wake.set()
         if self._t:
             self._t.join(timeout=2.0)
         self._t = None
         self._log.info("endpoint", "detector_stopped", {})
 
     # ---------- internals ----------
-    def _run(self):
-        while not self._stop.is_set():
+    def _run(self, stop: threading.Event):
+        while not stop.is_set():
             try:
                 up_now = self._is_kicad_running()
                 if self._want_state is None or self._want_state != up_now:
@@ -69,15 +162,72 @@ class EndpointDetector:
             except Exception as e:
                 self._log.error("endpoint", f"detector_error: {e}", {})
 
-            self._stop.wait(self._interval)
+            self._wake.wait(self._next_wait())
+            self._wake.clear()
+
+    def _next_wait(self) -> float:
+        # Poll quickly until a reading is confirmed, or when WMI isn't live.
+        if len(self._wmi_live) == len(_WMI_KINDS) and self._confirm_count >= 2:
+            return WMI_IDLE_RECHECK_SECONDS
+        return self._interval
+
+    def _watch_wmi(self, kind: str, stop: threading.Event, live: set):
+        """Wake the detector loop whenever kicad.exe is created/deleted."""
+        pythoncom.CoInitialize()  # COM is per-thread
+        try:
+            watcher = wmi.WMI().Win32_Process.watch_for(
+                notification_type=kind, Name="kicad.exe"
+            )
+        except Exception as e:
+            self._log.error("endpoint", f"wmi_watch_failed: {e}", {"kind": kind})
+            pythoncom.CoUninitialize()
+            return
+
+        live.add(kind)
+        try:
+            while not stop.is_set():
+                try:
+                    watcher(timeout_ms=1000)
+                except wmi.x_wmi_timed_out:
+                    continue
+                self._wake.set()
+        except Exception as e:
+            self._log.error("endpoint", f"wmi_watch_error: {e}", {"kind": kind})
+        finally:
+            live.discard(kind)
+            pythoncom.CoUninitialize()
 
     def _is_kicad_running(self) -> bool:
+        if _kernel32 is not None:
+            found = self._snapshot_has_kicad()
+            if found is not None:
+                return found
+        return self._psutil_has_kicad()
+
+    def _snapshot_has_kicad(self) -> Optional[bool]:
+        # None if the snapshot could not be taken (caller falls back to psutil).
+        h = _CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if not h or h == _INVALID_HANDLE_VALUE:
+            return None
+        try:
+            entry = _PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+            ok = _Process32FirstW(h, ctypes.byref(entry))
+            while ok:
+                if entry.szExeFile.lower() in _KICAD_NAMES:
+                    return True
+                ok = _Process32NextW(h, ctypes.byref(entry))
+            return False
+        finally:
+            _CloseHandle(h)
+
+    def _psutil_has_kicad(self) -> bool:
         # Cheap scan over process names; ignore access denied.
         for p in psutil.process_iter(attrs=["name"]):
             try:
-                name = (p.info.get("name") or "").lower()
+                name = (_get_name(p.info) or "").lower()
             except Exception:
                 continue
-            if name in self._name_candidates:
+            if name in _KICAD_NAMES:
                 return True
         return False
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
+import threading
 from pathlib import Path
-from typing import Any, Dict, Tuple, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple, Optional
+
+# Optional: faster JSON parser; stdlib json is used when it is missing.
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
 
 # Layout:
 #   ProjectRoot/
@@ -13,15 +23,34 @@ from typing import Any, Dict, Tuple, Optional
 #           system/
 #             config.py        <-- this file
 
+# Both resolved once at import (Path.resolve() hits the filesystem).
 _PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+_PROJECT_ROOT = _PACKAGE_ROOT.parent.parent
 DEFAULT_SETTINGS_PATH = _PACKAGE_ROOT / "settings.json"
 
+# Parsed settings per path: str(path) -> ((st_mtime_ns, st_size), data).
+# Shared by the GUI thread, the status poller and the pull/push workers, so
+# the populate step is locked and callers get read-only views.
+_SETTINGS_CACHE: Dict[str, Tuple[Tuple[int, int], Mapping[str, Any]]] = {}
+_SETTINGS_LOCK = threading.Lock()
+
 # Repo poll interval configuration (centralized here)
 DEFAULT_REPO_POLL_INTERVAL_SECONDS = 150
 MIN_REPO_POLL_INTERVAL_SECONDS = 30
+MAX_REPO_POLL_INTERVAL_SECONDS = 30 * 60  # upper bound when backing off
+
+# How long a successful remote fetch is reused before fetching again
+DEFAULT_FETCH_CACHE_SECONDS = 30
+
 
+def _freeze(value: Any) -> Any:
+    """Wrap dicts (recursively) in read-only MappingProxyType views."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
 
-def load_settings(settings_path: Path | None = None) -> Dict[str, Any]:
+
+def load_settings(settings_path: Path | None = None) -> Mapping[str, Any]:
     """
     Load the KiCadPartsSyncer settings.json.
 
@@ -29,31 +58,64 @@ def load_settings(settings_path: Path | None = None) -> Dict[str, Any]:
 
         {
           "repoPollIntervalSeconds": 60,          # optional
+          "repoStatusInProcess": true,            # optional, false = subprocess
+          "preferVsCode": false,                  # optional, open settings in VS Code
           "repository": {
             "name": "KiCadPartsLibrary",
             "localPath": "C:\\dev\\work\\KiCadPartsLibraries",
             "remoteName": "origin",               # optional, defaults to 'origin'
             "remoteUrl": "https://github.com/..." # optional, metadata only
+            "fetchCacheSeconds": 30,              # optional, 0 disables
+            "parallelFetch": true,                # optional, fetch submodules in parallel
             // "auth": { ... }                    # optional legacy HTTPS/PAT config
           }
         }
 
     Notes
     -----
+    - Parsed settings are memoized per path and reused until the file's
+      mtime/size changes, so repeated calls cost a single stat(). The
+      returned mapping (and every nested dict, such as 'repository') is
+      a read-only view shared across threads.
     - 'auth' is now optional and only used by legacy HTTPS/PAT-based flows.
       For SSH-based setups (recommended), 'auth' can be omitted entirely.
     """
     path = settings_path or DEFAULT_SETTINGS_PATH
 
-    if not path.is_file():
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise RuntimeError(
             "KiCadPartsSyncer settings.json not found at: {0}".format(path)
         )
 
+    key = str(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _SETTINGS_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with _SETTINGS_LOCK:
+        # Another thread may have parsed the same version while we waited.
+        cached = _SETTINGS_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        data = _freeze(_parse_settings(path))
+        _SETTINGS_CACHE[key] = (stamp, data)
+    return data
+
+
+def _parse_settings(path: Path) -> Dict[str, Any]:
+    raw = path.read_bytes()
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as exc:
+        # Both parsers' decode errors (and bad UTF-8) are ValueErrors.
+        if orjson is not None:
+            data = orjson.loads(raw)
+        else:
+            data = json.loads(raw.decode("utf-8"))
+    except ValueError as exc:
         raise RuntimeError(
             "Invalid JSON in KiCadPartsSyncer settings file: {0}".format(path)
         ) from exc
@@ -62,10 +124,19 @@ def load_settings(settings_path: Path | None = None) -> Dict[str, Any]:
         raise RuntimeError(
             "Root of KiCadPartsSyncer settings.json must be an object/dict."
         )
-
     return data
 
 
+def invalidate_settings_cache() -> None:
+    """
+    Drop all memoized settings so the next load_settings() re-reads disk.
+
+    Only needed when a change would not alter the file's mtime/size.
+    """
+    with _SETTINGS_LOCK:
+        _SETTINGS_CACHE.clear()
+
+
 def get_repository_auth(settings: Dict[str, Any]) -> Tuple[str, str]:
     """
     Extract (credential_target, username) from the loaded settings.
@@ -127,13 +198,8 @@ def get_repository_local_path(settings: Dict[str, Any]) -> Path:
     if path.is_absolute():
         return path
 
-    # Resolve relative to project root:
-    # DEFAULT_SETTINGS_PATH -> .../src/KiCadPartsSyncer/settings.json
-    # project_root = DEFAULT_SETTINGS_PATH.parent (KiCadPartsSyncer)
-    #                                   .parent (src)
-    #                                   .parent (ProjectRoot)
-    project_root = DEFAULT_SETTINGS_PATH.parent.parent.parent
-    return project_root / path
+    # Resolve relative to project root (ProjectRoot/src/KiCadPartsSyncer)
+    return _PROJECT_ROOT / path
 
 
 def get_repository_remote_name(settings: Dict[str, Any]) -> str:
@@ -166,6 +232,40 @@ def get_repository_remote_name(settings: Dict[str, Any]) -> str:
     return "origin"
 
 
+def get_repository_fetch_cache_seconds(settings: Dict[str, Any]) -> int:
+    """
+    Return how long (seconds) a remote fetch result may be reused.
+
+    Settings
+    --------
+    - repository.fetchCacheSeconds
+    - Missing/invalid values fall back to DEFAULT_FETCH_CACHE_SECONDS.
+    - 0 (or negative) disables the cache.
+    """
+    repo_cfg = settings.get("repository") or {}
+    raw = repo_cfg.get("fetchCacheSeconds", DEFAULT_FETCH_CACHE_SECONDS)
+
+    try:
+        return max(0, int(raw))
+    except (TypeError, ValueError):
+        return DEFAULT_FETCH_CACHE_SECONDS
+
+
+def get_repository_parallel_fetch(settings: Dict[str, Any]) -> bool:
+    """
+    Whether the status check's fetch should use
+    `--jobs=N --recurse-submodules=on-demand` (only for repositories with
+    submodules; pull never recurses into submodules).
+
+    Settings
+    --------
+    - repository.parallelFetch (bool), defaults to True.
+    """
+    repo_cfg = settings.get("repository") or {}
+    value = repo_cfg.get("parallelFetch", True)
+    return value if isinstance(value, bool) else True
+
+
 def get_repo_poll_interval_seconds(
     settings: Optional[Dict[str, Any]] = None
 ) -> int:
@@ -206,3 +306,43 @@ def get_repo_poll_interval_seconds(
         interval = MIN_REPO_POLL_INTERVAL_SECONDS
 
     return interval
+
+
+def get_prefer_vscode(settings: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Whether "open settings" should use VS Code instead of the file's
+    registered handler.
+
+    Settings
+    --------
+    - Root-level 'preferVsCode' (bool), defaults to False.
+    - If settings.json cannot be loaded (e.g. it is being fixed), False.
+    """
+    if settings is None:
+        try:
+            settings = load_settings()
+        except RuntimeError:
+            return False
+
+    value = settings.get("preferVsCode", False)
+    return value if isinstance(value, bool) else False
+
+
+def get_repo_status_in_process(settings: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Whether the repo status poller runs remote_checker in-process (default)
+    or as a `python -m` subprocess per poll.
+
+    Settings
+    --------
+    - Root-level 'repoStatusInProcess' (bool), defaults to True.
+    - If settings.json cannot be loaded, returns True.
+    """
+    if settings is None:
+        try:
+            settings = load_settings()
+        except RuntimeError:
+            return True
+
+    value = settings.get("repoStatusInProcess", True)
+    return value if isinstance(value, bool) else True
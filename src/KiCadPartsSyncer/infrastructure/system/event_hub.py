@@ -1,15 +1,72 @@
-
-from collections import defaultdict
-from typing import Callable, Type, Dict, List, Any
+import threading
+from typing import Callable, Type, Dict, Any, Iterable, Tuple
 
 class EventHub:
     def __init__(self):
-        self._subs: Dict[Type, List[Callable]] = defaultdict(list)
+        # Copy-on-write: handler tuples are replaced on (un)subscribe, so
+        # publish can iterate them without copying.
+        self._subs: Dict[Type, Tuple[Callable, ...]] = {}
+        # Event class -> (generation, handlers for the class and its bases).
+        # Bumping _gen on (un)subscribe invalidates every entry at once.
+        self._dispatch: Dict[Type, Tuple[int, Tuple[Callable, ...]]] = {}
+        self._gen = 0
+        # Publishers run on worker threads (poller, endpoint detector) while
+        # (un)subscribe runs on the GUI thread. Writers and cache fills take
+        # the lock; publish's cache hit stays lock-free.
+        self._lock = threading.Lock()
 
     def publish(self, evt: Any) -> None:
-        for handler in list(self._subs[type(evt)]):
-            handler(evt)
+        cls = type(evt)
+        entry = self._dispatch.get(cls)
+        if entry is None or entry[0] != self._gen:
+            entry = self._resolve(cls)
+        handlers = entry[1]
+        # Most event types have exactly one subscriber; skip the loop for them.
+        if len(handlers) == 1:
+            handlers[0](evt)
+        else:
+            for handler in handlers:
+                handler(evt)
+
+    def _resolve(self, cls: Type) -> Tuple[int, Tuple[Callable, ...]]:
+        # Handlers registered on a base class also receive subclass events.
+        with self._lock:
+            gen = self._gen
+            handlers: Tuple[Callable, ...] = ()
+            for base in cls.__mro__:
+                handlers += self._subs.get(base, ())
+            entry = self._dispatch[cls] = (gen, handlers)
+        return entry
 
     def subscribe(self, evt_type: Type, handler: Callable):
-        self._subs[evt_type].append(handler)
-        return lambda: self._subs[evt_type].remove(handler)
+        self._add(evt_type, handler)
+        return lambda: self._remove(evt_type, handler)
+
+    def subscribe_many(self, pairs: Iterable[Tuple[Type, Callable]]):
+        pairs = list(pairs)
+        # One lock hold and one generation bump: a concurrent publish sees
+        # either none or all of the batch, and the cache is invalidated once.
+        with self._lock:
+            subs = self._subs
+            for evt_type, handler in pairs:
+                subs[evt_type] = subs.get(evt_type, ()) + (handler,)
+            self._gen += 1
+
+        def _unsubscribe_all():
+            for evt_type, handler in pairs:
+                self._remove(evt_type, handler)
+
+        return _unsubscribe_all
+
+    def _add(self, evt_type: Type, handler: Callable) -> None:
+        with self._lock:
+            self._subs[evt_type] = self._subs.get(evt_type, ()) + (handler,)
+            self._gen += 1
+
+    def _remove(self, evt_type: Type, handler: Callable) -> None:
+        # Same contract as list.remove: drop one occurrence, ValueError if absent.
+        with self._lock:
+            handlers = list(self._subs.get(evt_type, ()))
+            handlers.remove(handler)
+            self._subs[evt_type] = tuple(handlers)
+            self._gen += 1
@@ -1,13 +1,100 @@
 
-import datetime as _dt
+import atexit
 import json
+import queue
+import sys
+import threading
+import time
+
+# Max records formatted into a single stdout write
+_BATCH_MAX = 256
+
+# Compact encoder bound once (no per-call kwargs handling). ASCII output is
+# kept so a non-UTF-8 console can't fail a whole batch.
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _escape(s):
+    """JSON string literal for s; plain printable ASCII skips the encoder."""
+    if type(s) is str and s.isascii() and s.isprintable() and '"' not in s and "\\" not in s:
+        return '"' + s + '"'
+    return _encode(s)
+
+
+def _iso_utc(t):
+    """Epoch seconds -> 'YYYY-MM-DDTHH:MM:SS.mmmZ' without a datetime object."""
+    return "{0}.{1:03d}Z".format(
+        time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t)), int(t % 1 * 1000)
+    )
+
 
 class Logger:
+    """
+    JSON-lines logger.
+
+    Log calls only enqueue the record; a daemon thread formats queued
+    records and writes them to stdout in batches (one write + flush per
+    batch). Pending records are flushed at interpreter exit.
+
+    Logging is best-effort: a failure to format or write a record is
+    swallowed here so callers never need to guard log calls themselves.
+    """
+
+    def __init__(self):
+        self._q = queue.SimpleQueue()
+        self._t = threading.Thread(target=self._drain, name="Logger", daemon=True)
+        self._t.start()
+        atexit.register(self._flush_and_join)
+
     def _emit(self, level, event, message, ctx):
-        ts = _dt.datetime.utcnow().isoformat() + "Z"
-        line = {"ts": ts, "level": level, "event": event, "msg": message, "ctx": ctx or {}}
-        print(json.dumps(line))
+        self._q.put((time.time(), level, event, message, ctx))
+
+    # ---------- writer thread ----------
+    def _drain(self):
+        while True:
+            item = self._q.get()
+            batch = [item]
+            while item is not None and len(batch) < _BATCH_MAX:
+                try:
+                    item = self._q.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            stop = batch[-1] is None
+            if stop:
+                batch.pop()
+            self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch):
+        lines = []
+        for t, level, event, message, ctx in batch:
+            try:
+                # Fixed schema, so the line is formatted directly; ts and
+                # level never need escaping.
+                lines.append(
+                    '{"ts":"%s","level":"%s","event":%s,"msg":%s,"ctx":%s}\n'
+                    % (_iso_utc(t), level, _escape(event), _escape(message), _encode(ctx or {}))
+                )
+            except Exception:
+                pass
+
+        out = sys.stdout  # None under pythonw
+        if not lines or out is None:
+            return
+        try:
+            out.write("".join(lines))
+            out.flush()
+        except Exception:
+            pass
+
+    def _flush_and_join(self):
+        self._q.put(None)
+        self._t.join(timeout=1.0)
 
+    # ---------- public API ----------
     def info(self, event, message, ctx=None):
         self._emit("INFO", event, message, ctx)
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import os
 import subprocess
 import shutil
 from pathlib import Path
@@ -17,14 +19,27 @@ def _get_settings_path() -> Path:
     return config.DEFAULT_SETTINGS_PATH
 
 
+# Editor lookups walk PATH x PATHEXT; resolve each once per process.
+@functools.lru_cache(maxsize=None)
+def _code_path() -> str | None:
+    return shutil.which("code")
+
+
+@functools.lru_cache(maxsize=None)
+def _notepad_path() -> str:
+    return shutil.which("notepad") or "notepad"
+
+
 def open_settings_in_editor() -> None:
     """
-    Open the KiCadPartsSyncer settings file in VS Code if available,
-    otherwise Notepad.
+    Open the KiCadPartsSyncer settings file with its registered handler
+    (Windows), or in VS Code if available, otherwise Notepad.
 
     - Ensures the directory exists
     - Creates an empty file if missing
-    - Prefers `code` (VS Code CLI) if on PATH (via shell)
+    - Uses os.startfile (ShellExecute, no child process to manage) unless
+      'preferVsCode' is true or startfile is unavailable/fails
+    - Prefers `code` (VS Code CLI) if on PATH, launched directly (no shell)
     - Falls back to `notepad` on Windows
 
     This function is best-effort and will silently do nothing if both
@@ -39,12 +54,24 @@ def open_settings_in_editor() -> None:
     if not settings_path.exists():
         settings_path.touch()
 
-    # --- Try VS Code first ---
-    # We just need to know if 'code' is on PATH; then we invoke it via the shell.
-    if shutil.which("code"):
+    # --- Registered handler (Windows) ---
+    if not config.get_prefer_vscode() and hasattr(os, "startfile"):
+        try:
+            os.startfile(str(settings_path))
+            return
+        except OSError:
+            # No association for .json, etc.; try the editors below.
+            pass
+
+    # --- Try VS Code ---
+    # which() resolves the full shim path (code.cmd on Windows), so it can be
+    # started directly instead of through an extra shell.
+    code_path = _code_path()
+    if code_path:
+        # The shim is a console script; don't flash a console window for it.
+        flags = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
         try:
-            # Use shell=True so the VS Code shim (code.cmd) runs correctly on Windows.
-            subprocess.Popen(["code", str(settings_path)], shell=True)
+            subprocess.Popen([code_path, str(settings_path)], creationflags=flags)
             return
         except OSError:
             # If VS Code launch fails for any reason, fall back to Notepad.
@@ -52,8 +79,7 @@ def open_settings_in_editor() -> None:
 
     # --- Fallback: Notepad ---
     try:
-        notepad_exe = shutil.which("notepad") or "notepad"
-        subprocess.Popen([notepad_exe, str(settings_path)])
+        subprocess.Popen([_notepad_path(), str(settings_path)])
     except OSError:
         # Final failure – nothing more we can do here without a logger/UI.
         # We deliberately swallow the error to avoid crashing the app.
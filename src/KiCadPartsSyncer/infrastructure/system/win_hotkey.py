@@ -36,6 +36,15 @@ VK_OEM_3 = 0xC0
 # RegisterHotKey receives either a window handle or 0 (NULL) to bind to the calling thread.
 user32 = ctypes.windll.user32
 
+# Bound once with explicit signatures (no per-call attribute lookup or default marshalling)
+_RegisterHotKey = user32.RegisterHotKey
+_RegisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+_RegisterHotKey.restype = wintypes.BOOL
+
+_UnregisterHotKey = user32.UnregisterHotKey
+_UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+_UnregisterHotKey.restype = wintypes.BOOL
+
 # Define MSG structure for event decoding
 class MSG(ctypes.Structure):
     _fields_ = [
@@ -49,6 +58,14 @@ class MSG(ctypes.Structure):
     ]
 
 
+# Field offsets so the filter can peek at single MSG fields without copying the struct
+_MSG_OFFSET = MSG.message.offset
+_WPARAM_OFFSET = MSG.wParam.offset
+# A tuple, not a set: PySide6 may pass eventType as a QByteArray, which
+# compares equal to bytes but does not hash like them.
+_MSG_EVENT_TYPES = (b"windows_generic_MSG", b"windows_dispatcher_MSG")
+
+
 class _NativeHotkeyFilter(QAbstractNativeEventFilter):
     """
     Installs on the QApplication to receive WM_HOTKEY from the thread message queue.
@@ -58,23 +75,47 @@ class _NativeHotkeyFilter(QAbstractNativeEventFilter):
     def __init__(self, callback_lookup: dict[int, callable]):
         super().__init__()
         self._callbacks = callback_lookup
+        # Callbacks indexed by hotkey id (ids are small ints chosen by the caller).
+        # Rebuilt and swapped as a whole, so the filter never sees a half-updated list.
+        self._cb_arr: list = []
+        # (id, callback) fast path for the usual case of exactly one hotkey;
+        # id -1 = not in use (wParam is unsigned so it never matches).
+        self._single: tuple = (-1, None)
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Refresh the id-indexed lookup after callback_lookup changed."""
+        arr = [None] * (max(self._callbacks, default=-1) + 1)
+        for hotkey_id, cb in self._callbacks.items():
+            if hotkey_id >= 0:
+                arr[hotkey_id] = cb
+        self._cb_arr = arr
+        if len(self._callbacks) == 1:
+            self._single, = self._callbacks.items()
+        else:
+            self._single = (-1, None)
 
     def nativeEventFilter(self, eventType: bytes, message: int) -> tuple[bool, int]:  # type: ignore[override]
         # eventType is a bytes string; on Windows we expect b"windows_generic_MSG" or b"windows_dispatcher_MSG"
-        if eventType not in (b"windows_generic_MSG", b"windows_dispatcher_MSG"):
+        if eventType not in _MSG_EVENT_TYPES:
             return (False, 0)
 
-        # message is a pointer to MSG
+        # message is a pointer to MSG; this runs for every native event, so
+        # only the message word is read until we know it is a WM_HOTKEY.
         # msg = ctypes.cast(message, ctypes.POINTER(MSG)).contents <---- ERROR
         try:
             ptr = int(message)  # works for sip.voidptr / c_void_p / int
-            msg = MSG.from_address(ptr)
         except (TypeError, ValueError):
             # If we can't interpret it, ignore this event; don't crash.
             return False, 0
-        if msg.message == WM_HOTKEY:
-            hotkey_id = int(msg.wParam)
-            cb = self._callbacks.get(hotkey_id)
+        if wintypes.UINT.from_address(ptr + _MSG_OFFSET).value == WM_HOTKEY:
+            hotkey_id = wintypes.WPARAM.from_address(ptr + _WPARAM_OFFSET).value
+            single = self._single
+            if hotkey_id == single[0]:
+                cb = single[1]
+            else:
+                cb_arr = self._cb_arr
+                cb = cb_arr[hotkey_id] if hotkey_id < len(cb_arr) else None
             if cb:
                 try:
                     cb()
@@ -106,7 +147,9 @@ class WinHotkeyManager(QObject):
         self._app = app
         self._callbacks: dict[int, callable] = {}
         self._filter = _NativeHotkeyFilter(self._callbacks)
-        self._app.installNativeEventFilter(self._filter)
+        # The filter sees every native event, so it is only installed while
+        # at least one hotkey is registered (see _sync_filter).
+        self._installed = False
 
         # Keep track of registered ids so we can unregister on exit
         self._registered_ids: set[int] = set()
@@ -124,26 +167,43 @@ class WinHotkeyManager(QObject):
         if id in self._registered_ids:
             self.unregister(id)
 
-        ok = bool(user32.RegisterHotKey(None, id, modifiers, vk))
+        ok = bool(_RegisterHotKey(None, id, modifiers, vk))
         if ok:
             self._callbacks[id] = callback
             self._registered_ids.add(id)
+            self._filter.rebuild()
+            self._sync_filter()
         return ok
 
     def unregister(self, id: int) -> None:
         if id in self._registered_ids:
             try:
-                user32.UnregisterHotKey(None, id)
+                _UnregisterHotKey(None, id)
             except Exception:
                 pass
             self._registered_ids.discard(id)
         self._callbacks.pop(id, None)
+        self._filter.rebuild()
+        self._sync_filter()
 
     def unregister_all(self) -> None:
         for id in list(self._registered_ids):
             try:
-                user32.UnregisterHotKey(None, id)
+                _UnregisterHotKey(None, id)
             except Exception:
                 pass
             self._callbacks.pop(id, None)
             self._registered_ids.discard(id)
+        self._filter.rebuild()
+        self._sync_filter()
+
+    def _sync_filter(self) -> None:
+        """Install the native event filter iff any hotkey is registered."""
+        want = bool(self._registered_ids)
+        if want == self._installed:
+            return
+        if want:
+            self._app.installNativeEventFilter(self._filter)
+        else:
+            self._app.removeNativeEventFilter(self._filter)
+        self._installed = want
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
+import functools
+from pathlib import Path
 from typing import Optional, Dict
 
-from PySide6.QtCore import Qt, QTimer, QPoint, QSize, Signal, Slot, QThread, QObject, QEvent
-from PySide6.QtGui import QGuiApplication, QCursor
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QFrame, QApplication
+from PySide6.QtCore import Qt, QTimer, QPoint, QSize, Signal, Slot
+from PySide6.QtGui import QGuiApplication, QCursor, QPainter, QColor, QBrush, QPen
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QFrame, QApplication
 
 try:
     from ..infrastructure.system import win_clickthrough
@@ -13,6 +15,92 @@ except Exception:
 
 from KiCadPartsSyncer.infrastructure.system.settings_opener import open_settings_in_editor
 
+_HUD_QSS_PATH = Path(__file__).parent / "resources" / "hud.qss"
+
+# Drag repositions are flushed at most this often (~one per 60 Hz frame)
+_DRAG_MOVE_INTERVAL_MS = 16
+
+# How long flash() keeps the HUD up
+_FLASH_MS = 600
+
+
+@functools.lru_cache(maxsize=None)
+def _hud_stylesheet() -> str:
+    try:
+        return _HUD_QSS_PATH.read_text(encoding="utf-8")
+    except OSError:
+        return ""  # unstyled HUD rather than no HUD
+
+
+def install_hud_stylesheet(app: QApplication) -> None:
+    """
+    Append the HUD rules (resources/hud.qss) to the application stylesheet.
+
+    Qt parses an application stylesheet once and shares it across widgets,
+    unlike a per-widget setStyleSheet. Safe to call repeatedly.
+    """
+    qss = _hud_stylesheet()
+    current = app.styleSheet()
+    if qss and qss not in current:
+        app.setStyleSheet(current + "\n" + qss if current else qss)
+
+
+class _DragFrame(QFrame):
+    """
+    HUD card that drags its top-level window with the left mouse button.
+
+    Mouse handlers instead of an event filter, so only mouse events aimed
+    at the card (or bubbling up from its children) reach Python.
+    """
+
+    def __init__(self, overlay: "Overlay"):
+        super().__init__(overlay)
+        self._overlay = overlay
+
+    def mousePressEvent(self, ev) -> None:
+        o = self._overlay
+        # Only allow dragging when not in click-through mode
+        if o._click_through or not ev.buttons() & Qt.LeftButton:
+            return super().mousePressEvent(ev)
+        # Begin drag: capture offset between cursor and window top-left.
+        # Frameless, so pos() is the frame's top-left without building a QRect.
+        o._drag_active = True
+        o._drag_offset = ev.globalPosition().toPoint() - o.pos()
+        ev.accept()
+
+    def mouseMoveEvent(self, ev) -> None:
+        o = self._overlay
+        if o._click_through or not o._drag_active:
+            return super().mouseMoveEvent(ev)
+        # Coalesce moves: at most one window reposition per timer tick
+        o._pending_pos = ev.globalPosition().toPoint() - o._drag_offset
+        if not o._move_timer.isActive():
+            o._move_timer.start()
+        ev.accept()
+
+    def mouseReleaseEvent(self, ev) -> None:
+        o = self._overlay
+        if o._click_through or not o._drag_active:
+            return super().mouseReleaseEvent(ev)
+        o._drag_active = False
+        o._flush_move()  # land exactly on the final position
+        ev.accept()
+
+
+class _HudButton(QPushButton):
+    """Round 20x20 glyph button of the expanded HUD panel."""
+
+    SIZE = 20
+
+    def __init__(self, glyph: str, tooltip: str, parent: QWidget):
+        super().__init__(glyph, parent)
+        self.setObjectName("panel_button")
+        # Fixed in code rather than via QSS min/max-width/height, so the
+        # style sheet doesn't have to resolve size metrics per button.
+        self.setFixedSize(self.SIZE, self.SIZE)
+        self.setToolTip(tooltip)
+
+
 class Overlay(QWidget):
     """
     Always-on-top HUD overlay that stays off the taskbar (Qt.Tool).
@@ -37,20 +125,59 @@ class Overlay(QWidget):
 
     def __init__(self, hub):
         super().__init__(None)
+        # Before any child exists, so the card is polished once with it
+        app = QApplication.instance()
+        if app is not None:
+            install_hud_stylesheet(app)
+            app.screenRemoved.connect(self._forget_screen)
         self._hub = hub
+        # Screen the HUD was last clamped to; reused while targets stay on it
+        self._last_screen = None
         self._click_through = False
         self._frozen = False #ToDo: This should probably be removed now
         self._is_expanded = False
+        self._size_applied = False  # set once _update_size_for_state has run
         self._status = "unknown"  # 'unknown' | 'clean' | 'diverged'
         # self._collapsed_size = QSize(120, 60) #ToDo: Probably should remove these
         # self._expanded_size = QSize(120, 220)
 
+        # Paint resources, built once: (status, click_through) -> (brush, pen).
+        # While click-through is on the border is fully opaque so it stands out.
+        self._paint_cache = {}
+        for status, bg, border in (
+            ("clean", QColor(0, 170, 0, 220), QColor(0, 90, 0, 230)),            # in sync: green
+            ("diverged", QColor(200, 40, 40, 220), QColor(255, 100, 100, 230)),  # remote/local ahead: red
+            ("unknown", QColor(230, 200, 40, 220), QColor(180, 140, 0, 230)),    # not configured/cannot check: yellow
+        ):
+            brush = QBrush(bg)
+            self._paint_cache[(status, False)] = (brush, QPen(border))
+            self._paint_cache[(status, True)] = (brush, QPen(QColor(border.red(), border.green(), border.blue(), 255)))
+
         # Drag state
         self._drag_active = False
         self._drag_offset = QPoint(0, 0)
-
-        # Window flags: topmost, not in taskbar, frameless (we add manual dragging)
-        self.setWindowFlags(Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self._pending_pos: Optional[QPoint] = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(_DRAG_MOVE_INTERVAL_MS)
+        self._move_timer.setTimerType(Qt.PreciseTimer)
+        self._move_timer.timeout.connect(self._flush_move)
+
+        # Reused single-shot timers (restarting an active one coalesces calls)
+        self._nudge_timer = QTimer(self)
+        self._nudge_timer.setSingleShot(True)
+        self._nudge_timer.setInterval(0)
+        self._nudge_timer.timeout.connect(self._nudge_front)
+        self._flash_timer = QTimer(self)
+        self._flash_timer.setSingleShot(True)
+        self._flash_timer.setInterval(_FLASH_MS)
+        self._flash_timer.timeout.connect(self.hide_overlay)
+
+        # Window flags: topmost, not in taskbar, frameless (we add manual dragging).
+        # setWindowFlags recreates the native window, so the last applied
+        # value is cached and re-applying the same flags is skipped.
+        self._current_flags = self._wanted_flags()
+        self.setWindowFlags(self._current_flags)
         self.setAttribute(Qt.WA_ShowWithoutActivating, True)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
 
@@ -58,99 +185,14 @@ class Overlay(QWidget):
         outer = QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
 
-        self._card = QFrame(self)
+        self._card = _DragFrame(self)
         self._card.setObjectName("hud")
-        self._card.setStyleSheet("""
-            #hud {
-                background: rgba(10, 10, 10, 100);
-                color:#FFFFFF;
-                border:1px solid #555;
-                border-radius:8px;
-            }
-            QLabel#t {
-                font-size:12pt;
-                font-weight:600;
-                padding:8px 10px 2px 10px;
-                color: #FFFFFF
-            }
-            QLabel#b {
-                padding:0 10px 8px 10px;
-                color: #FFFFFF
-            }
-            QPushButton {
-                margin:0 10px 10px 10px;
-            }
-            QPushButton#toggle {
-                margin: 0;
-                padding: 0;
-                color: #FFFFFF;
-                background: transparent;
-                border: none;
-            }
-            QPushButton#toggle:hover {
-                color: #CCCCCC;
-            }
-            QPushButton#panel_button {
-                min-width: 20px;
-                max-width: 20px;
-                min-height: 20px;
-                max-height: 20px;
-                padding: 0;
-                margin: 2px 0;
-                border-radius: 10px;
-                background: transparent;
-                color: #FFFFFF;
-                border: 1px solid #555;
-            }
-            QPushButton#panel_button:hover {
-                background: rgba(255, 255, 255, 25);
-            }
-        """)
 
         inner = QVBoxLayout(self._card)
         inner.setContentsMargins(4, 8, 4, 8)
 
-        self._panel = QWidget(self._card)
-        self._panel_layout = QVBoxLayout(self._panel)
-        self._panel_layout.setContentsMargins(0, 0, 0, 0)
-        # start with the panel collapsed
-        self._panel.setVisible(False)
-
-        # Panel Buttons
-        # 🡅 Push, 🡇 Pull, ⚙ Settings, 👁 Hide
-        self._btn_push = QPushButton("🡅", self._panel)
-        self._btn_push.setObjectName("panel_button")
-        self._btn_push.setToolTip("Push")
-        self._btn_push.clicked.connect(self._on_push_clicked)
-
-        self._btn_pull = QPushButton("🡇", self._panel)
-        self._btn_pull.setObjectName("panel_button")
-        self._btn_pull.setToolTip("Pull")
-        self._btn_pull.clicked.connect(self._on_pull_clicked)
-
-        self._btn_settings = QPushButton("⚙", self._panel)
-        self._btn_settings.setObjectName("panel_button")
-        self._btn_settings.setToolTip("Settings")
-        self._btn_settings.clicked.connect(self._on_settings_clicked)
-
-        self._btn_hide = QPushButton("👁", self._panel)
-        self._btn_hide.setObjectName("panel_button")
-        self._btn_hide.setToolTip("Hide")
-        self._btn_hide.clicked.connect(self.hide_overlay)
-
-        self._panel_layout.addWidget(self._btn_push,     0, Qt.AlignHCenter)
-        self._panel_layout.addWidget(self._btn_pull,     0, Qt.AlignHCenter)
-        self._panel_layout.addWidget(self._btn_settings, 0, Qt.AlignHCenter)
-        self._panel_layout.addWidget(self._btn_hide,     0, Qt.AlignHCenter)
-
-        self._title = QLabel("KiCad Parts Syncer", self) #ToDo: Remove
-        self._title.setObjectName("t") #ToDo: Remove
-        self._title.hide() #ToDo: Remove
-        
-
-        self._body  = QLabel("Idle", self) #ToDo: Remove
-        self._body.setObjectName("b") #ToDo: Remove
-        self._body.hide() #ToDo: Remove
+        # Expanded button panel; built on first expand (_ensure_panel)
+        self._panel: Optional[QWidget] = None
 
         self._toggle = QPushButton("▼", self._card)
         self._toggle.setObjectName("toggle")
@@ -163,24 +205,19 @@ class Overlay(QWidget):
 
         # self._btnHide = QPushButton("Hide", self._card)
         # self._btnHide.clicked.connect(self.hide_overlay)
-        # inner.addWidget(self._title)
-        # inner.addWidget(self._body)
         # inner.addWidget(self._btnHide)
-        inner.addWidget(self._panel)
         inner.addStretch()
         inner.addWidget(self._toggle, 0, Qt.AlignHCenter)
 
         outer.addWidget(self._card)
         self._set_expanded(False)
 
-        # Thread-safe wiring: ensure UI ops run on GUI thread
-        self._sig_show.connect(self._show_impl, Qt.QueuedConnection)
-        self._sig_hide.connect(self._hide_impl, Qt.QueuedConnection)
-        self._sig_set_status.connect(self._set_status_impl, Qt.QueuedConnection)
-
-        # Accept mouse events on both the frame and the top-level for dragging
-        self._card.installEventFilter(self)
-        self.installEventFilter(self)
+        # Thread-safe wiring: ensure UI ops run on GUI thread. AutoConnection
+        # lets Qt pick per emit: a direct call when emitted on the GUI thread,
+        # queued from any other thread.
+        self._sig_show.connect(self._show_impl, Qt.AutoConnection)
+        self._sig_hide.connect(self._hide_impl, Qt.AutoConnection)
+        self._sig_set_status.connect(self._set_status_impl, Qt.AutoConnection)
 
     # ---------- public API (thread-safe entry points) ----------
 
@@ -195,10 +232,7 @@ class Overlay(QWidget):
           - 'clean'    -> green  (in sync)
           - 'diverged' -> red    (remote or local ahead)
         """
-        if self._on_gui_thread():
-            self._set_status_impl(status)
-        else:
-            self._sig_set_status.emit(status)
+        self._sig_set_status.emit(status)
 
     def appear_idle(self) -> None:
         self.hide_overlay()
@@ -208,52 +242,45 @@ class Overlay(QWidget):
 
     def show_overlay(self, info: Optional[Dict] = None, pos: Optional[QPoint] = None) -> None:
         """Thread-safe: may be called from any thread."""
-        if self._on_gui_thread():
-            self._show_impl(info, pos)
-        else:
-            self._sig_show.emit(info, pos)
+        self._sig_show.emit(info, pos)
 
+    @Slot()
     def hide_overlay(self) -> None:
         """Thread-safe: may be called from any thread."""
-        if self._on_gui_thread():
-            self._hide_impl()
-        else:
-            self._sig_hide.emit()
+        self._sig_hide.emit()
 
     # def show_centered(self) -> None:
     #     self._show_impl(None, None)
 
     def flash(self) -> None:
         self.show_overlay()
-        QTimer.singleShot(600, self.hide_overlay)
+        self._flash_timer.start()
 
     def set_click_through(self, enabled: bool) -> None:
         """Enable/disable click-through (mouse input passes to windows underneath)."""
-        self._click_through = bool(enabled)
+        enabled = bool(enabled)
+        if enabled == self._click_through:
+            return
+        self._click_through = enabled
+
+        # Windows: WS_EX_TRANSPARENT alone makes the HUD click-through, so the
+        # Qt flag (which recreates the native window) is left alone.
+        if win_clickthrough is not None:
+            if enabled:
+                win_clickthrough.enable_click_through(self)
+            else:
+                win_clickthrough.disable_click_through(self)
+            self.update()  # border opacity follows click-through
+            return
 
         # Remember visibility + geometry so flag changes don't nudge the HUD.
         was_visible = self.isVisible()
         if was_visible:
             old_geom = self.geometry()
 
-        # Qt flag-based click-through (cross-platform where supported)
-        f = self.windowFlags()
-        if enabled:
-            f |= Qt.WindowTransparentForInput
-        else:
-            f &= ~Qt.WindowTransparentForInput
-        self.setWindowFlags(f)
-
-        # Apply Win32 extended style as well for robustness, if available
-        if win_clickthrough is None:
-            # Fallback: Qt-only behavior
-            self.setAttribute(Qt.WA_TransparentForMouseEvents, enabled)
-            return
-
-        if enabled:
-            win_clickthrough.enable_click_through(self)
-        else:
-            win_clickthrough.disable_click_through(self)
+        # Fallback: Qt flag-based click-through (cross-platform where supported)
+        self._apply_window_flags()
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, enabled)
 
         if was_visible:
             # Flags changes require a show() to take effect; restore original position.
@@ -286,17 +313,60 @@ class Overlay(QWidget):
             s = "unknown"
         if s != self._status:
             self._status = s
-            self.update()  # trigger repaint with new color
+            # Hidden: the next show paints with the new color anyway
+            if self.isVisible():
+                self.update()  # trigger repaint with new color
 
     def _set_expanded(self, expanded: bool) -> None:
-        self._is_expanded = bool(expanded)
-        self._panel.setVisible(self._is_expanded)
+        expanded = bool(expanded)
+        # Collapsing an already collapsed HUD (every hide) needs no layout pass
+        if expanded == self._is_expanded and self._size_applied:
+            return
+        self._is_expanded = expanded
+        if self._is_expanded:
+            self._ensure_panel()
+        if self._panel is not None:
+            self._panel.setVisible(self._is_expanded)
         self._toggle.setText("▲" if self._is_expanded else "▼")
         self._toggle.setToolTip("Collapse" if self._is_expanded else "Expand")
         # target = self._expanded_size if self._is_expanded else self._collapsed_size
         # self.resize(target)
         self._update_size_for_state()
 
+    def _ensure_panel(self) -> None:
+        """Build the push/pull/settings/hide panel the first time it's needed."""
+        if self._panel is not None:
+            return
+
+        self._panel = QWidget(self._card)
+        self._panel_layout = QVBoxLayout(self._panel)
+        self._panel_layout.setContentsMargins(0, 0, 0, 0)
+        # start with the panel collapsed
+        self._panel.setVisible(False)
+
+        # Panel Buttons
+        # 🡅 Push, 🡇 Pull, ⚙ Settings, 👁 Hide
+        self._btn_push = _HudButton("🡅", "Push", self._panel)
+        self._btn_push.clicked.connect(self._on_push_clicked)
+
+        self._btn_pull = _HudButton("🡇", "Pull", self._panel)
+        self._btn_pull.clicked.connect(self._on_pull_clicked)
+
+        self._btn_settings = _HudButton("⚙", "Settings", self._panel)
+        self._btn_settings.clicked.connect(self._on_settings_clicked)
+
+        self._btn_hide = _HudButton("👁", "Hide", self._panel)
+        self._btn_hide.clicked.connect(self.hide_overlay)
+
+        self._panel_layout.addWidget(self._btn_push,     0, Qt.AlignHCenter)
+        self._panel_layout.addWidget(self._btn_pull,     0, Qt.AlignHCenter)
+        self._panel_layout.addWidget(self._btn_settings, 0, Qt.AlignHCenter)
+        self._panel_layout.addWidget(self._btn_hide,     0, Qt.AlignHCenter)
+
+        # Same slot as before: above the stretch and the toggle button
+        self._card.layout().insertWidget(0, self._panel)
+
+    @Slot()
     def _toggle_expanded(self) -> None:
         self._set_expanded(not self._is_expanded)
 
@@ -313,33 +383,16 @@ class Overlay(QWidget):
         height = hint.height()
 
         self.setFixedSize(width, height)
+        self._size_applied = True
 
     def paintEvent(self, e):
-        from PySide6.QtGui import QPainter, QColor, QBrush
-
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing, True)
 
-        # Map _status -> background/border
-        if getattr(self, "_status", "unknown") == "clean":
-            # In sync
-            bg = QColor(0, 170, 0, 220)        # green
-            border = QColor(0, 90, 0, 230)
-        elif self._status == "diverged":
-            # Remote or local ahead
-            bg = QColor(200, 40, 40, 220)      # red
-            border = QColor(255, 100, 100, 230)
-        else:
-            # Default / unknown / not configured / cannot check
-            bg = QColor(230, 200, 40, 220)     # yellow
-            border = QColor(180, 140, 0, 230)
-
-        # If click-through is enabled, make border fully opaque so it stands out
-        if getattr(self, "_click_through", False):
-            border = QColor(border.red(), border.green(), border.blue(), 255)
-
-        p.setBrush(QBrush(bg))
-        p.setPen(border)
+        # Map _status -> background/border (_set_status_impl keeps it a known key)
+        brush, pen = self._paint_cache[(self._status, self._click_through)]
+        p.setBrush(brush)
+        p.setPen(pen)
 
         r = self.rect().adjusted(1, 1, -1, -1)
         p.drawRoundedRect(r, 10, 10)
@@ -360,46 +413,13 @@ class Overlay(QWidget):
             return QSize(120, hint.height())
         return QSize(120, 40)
 
-    def eventFilter(self, obj: QObject, ev: QEvent) -> bool:
-        # Only allow dragging when not in click-through mode
-        if self._click_through:
-            return super().eventFilter(obj, ev)
-
-        if ev.type() == QEvent.MouseButtonPress and ev.buttons() & Qt.LeftButton:
-            # Begin drag: capture offset between cursor and window top-left
-            global_pos = ev.globalPosition().toPoint() if hasattr(ev, 'globalPosition') else QCursor.pos()
-            self._drag_active = True
-            self._drag_offset = global_pos - self.frameGeometry().topLeft()
-            return True
-
-        if ev.type() == QEvent.MouseMove and self._drag_active:
-            global_pos = ev.globalPosition().toPoint() if hasattr(ev, 'globalPosition') else QCursor.pos()
-            new_top_left = global_pos - self._drag_offset
-            self.move(new_top_left)
-            return True
-
-        if ev.type() == QEvent.MouseButtonRelease and self._drag_active:
-            self._drag_active = False
-            return True
-
-        return super().eventFilter(obj, ev)
-
     # def _restore_border(self) -> None:
     #     self._card.setStyleSheet(self._card.styleSheet())
 
-    def _on_gui_thread(self) -> bool:
-        app = QGuiApplication.instance() or QApplication.instance()
-        return QThread.currentThread() == app.thread() if app else True
-
     @Slot(object, object)
     def _show_impl(self, info: Optional[Dict], pos: Optional[QPoint]) -> None:
-        # update content
-        if info:
-            title = info.get("title") or "KiCad Parts Syncer HUD"
-            body  = info.get("body")  or "Connected to KiCad"
-        else:
-            title, body = "KiCad Parts Syncer HUD", "Active"
-        self._title.setText(title); self._body.setText(body)
+        # `info` (title/body) is accepted for API compatibility; the HUD has
+        # no text labels to render it into.
 
         # Find starting position
         if pos is not None:
@@ -408,33 +428,59 @@ class Overlay(QWidget):
             c = QCursor.pos()
             target = QPoint(c.x() + 16, c.y() + 16)
 
-        # Clamp to active screen
-        screen = QGuiApplication.screenAt(target) or QGuiApplication.primaryScreen()
-        g = screen.availableGeometry()
+        # Clamp to active screen (usually the same one as last time, so try
+        # that before asking Qt to search every screen)
+        screen = self._last_screen
+        g = screen.availableGeometry() if screen is not None else None
+        if g is None or not g.contains(target):
+            screen = QGuiApplication.screenAt(target) or QGuiApplication.primaryScreen()
+            self._last_screen = screen
+            g = screen.availableGeometry()
         w, h = self.width(), self.height()
         x = max(g.left(), min(target.x(), g.right() - w))
         y = max(g.top(),  min(target.y(), g.bottom() - h))
         self.move(QPoint(x, y))
 
-        # Re-apply flags every show path (z-order & click-through)
-        flags = Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
-        if self._click_through:
-            flags |= Qt.WindowTransparentForInput
-        self.setWindowFlags(flags)
+        # Make sure flags match the click-through state (no-op if unchanged)
+        self._apply_window_flags()
 
         # Show & nudge front
         # self._body.setGeometry(self.rect())
         self.show()
-        self._body.style().polish(self._body)
-        self._body.update()
         self.raise_()
-        QTimer.singleShot(0, self._nudge_front)
+        # Back-to-back shows (e.g. repeated flash()) share one pending nudge
+        self._nudge_timer.start()
 
     @Slot()
     def _hide_impl(self) -> None:
         self._set_expanded(False)
         self.hide()
 
+    def _wanted_flags(self):
+        flags = Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
+        # On Windows click-through is the WS_EX_TRANSPARENT style instead
+        if self._click_through and win_clickthrough is None:
+            flags |= Qt.WindowTransparentForInput
+        return flags
+
+    def _apply_window_flags(self) -> None:
+        flags = self._wanted_flags()
+        if flags != self._current_flags:
+            self._current_flags = flags
+            self.setWindowFlags(flags)
+
+    @Slot()
+    def _forget_screen(self) -> None:
+        # A removed QScreen must not be touched again
+        self._last_screen = None
+
+    @Slot()
+    def _flush_move(self) -> None:
+        pos, self._pending_pos = self._pending_pos, None
+        if pos is not None:
+            self.move(pos)
+
+    @Slot()
     def _nudge_front(self) -> None:
         # re-raise shortly after show to combat z-order weirdness on Windows
         try:
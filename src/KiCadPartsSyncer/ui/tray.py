@@ -2,7 +2,26 @@ from __future__ import annotations
 import os
 from pathlib import Path
 from PySide6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtGui import QIcon
+
+# Icon next to this file; built once at import (no realpath/stat per start)
+_ICON_PATH = str(Path(__file__).parent / "resources" / "KiCadPartsSyncer.ico")
+
+
+def _build_tray_menu(app: QApplication, overlay, show_centered) -> QMenu:
+    """
+    Tray context menu: Show HUD / Hide HUD / Quit.
+
+    Actions are created by the menu itself (addAction(text, slot)), so they
+    are parented to it and need no Python-side QAction objects.
+    """
+    menu = QMenu()
+    menu.addAction("Show HUD", show_centered)  # shows in center of screen
+    # WAS: connected to overlay.show_centered
+    menu.addAction("Hide HUD", overlay.hide_overlay)
+    menu.addSeparator()
+    menu.addAction("Quit", app.quit)
+    return menu
 
 
 class Tray:
@@ -21,50 +40,30 @@ class Tray:
         self.overlay = overlay
         self.hub = hub
 
-        # Resolve icon path relative to this file
-        base_dir = Path(__file__).resolve().parent
-        icon_path = base_dir / "resources" / "KiCadPartsSyncer.ico"
+        # Target of "Show HUD", resolved once instead of probed per click:
+        # overlay.show_centered(), else show_overlay(), else show().
+        self._show_centered_target = (
+            getattr(overlay, "show_centered", None)
+            or getattr(overlay, "show_overlay", None)
+            or overlay.show
+        )
 
-        icon = QIcon(str(icon_path))
+        icon = QIcon(_ICON_PATH)
         self.tray = QSystemTrayIcon(icon, self.app)
         self.tray.setToolTip("KiCad Parts Syncer")
 
-        self.menu = QMenu()
-
-        a_center = QAction("Show HUD", self.menu)  # shows in center of screen
-        # WAS: a_center.triggered.connect(self.overlay.show_centered)
-        a_center.triggered.connect(self._show_centered)
-        self.menu.addAction(a_center)
-
-        a_hide = QAction("Hide HUD", self.menu)
-        a_hide.triggered.connect(self.overlay.hide_overlay)
-        self.menu.addAction(a_hide)
-
-        self.menu.addSeparator()
-
-        a_quit = QAction("Quit", self.menu)
-        a_quit.triggered.connect(self.app.quit)
-        self.menu.addAction(a_quit)
-
+        self.menu = _build_tray_menu(self.app, self.overlay, self._show_centered)
         self.tray.setContextMenu(self.menu)
 
         self.tray.setVisible(True)
-        self.tray.show()
 
         # left-click toggles HUD quickly
         self.tray.activated.connect(self._on_click)
 
     def _show_centered(self) -> None:
-        """
-        Prefer overlay.show_centered(); fall back to show_overlay(); then show().
-        Keeps existing behavior if show_centered exists, avoids AttributeError if not.
-        """
-        if hasattr(self.overlay, "show_centered"):
-            self.overlay.show_centered()
-        elif hasattr(self.overlay, "show_overlay"):
-            self.overlay.show_overlay()
-        else:
-            self.overlay.show()
+        # Wrapper rather than connecting the target directly: triggered(bool)
+        # would otherwise be passed on as show_overlay's `info` argument.
+        self._show_centered_target()
 
     def _on_click(self, reason: QSystemTrayIcon.ActivationReason):
         if reason == QSystemTrayIcon.Trigger:
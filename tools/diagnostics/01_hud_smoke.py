@@ -3,38 +3,13 @@ import sys
 from PySide6.QtCore import Qt, QTimer, QRect, QSize
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtWidgets import QApplication, QWidget, QLabel
-
-def _apply_dpi_policy_if_available():
-    policy_enum = getattr(Qt, "HighDpiScaleFactorRoundingPolicy", None)
-    setter = getattr(QGuiApplication, "setHighDpiScaleFactorRoundingPolicy", None)
-    if policy_enum is not None and setter is not None:
-        try:
-            setter(policy_enum.PassThrough)
-        except Exception:
-            pass
-
-def flags_to_str(f: Qt.WindowType) -> str:
-    names = []
-    for name in [
-        "Tool",
-        "FramelessWindowHint",
-        "WindowStaysOnTopHint",
-        "BypassWindowManagerHint",
-        "WindowTransparentForInput",
-        "NoDropShadowWindowHint",
-        "X11BypassWindowManagerHint",
-    ]:
-        if f & getattr(Qt, name):
-            names.append(name)
-    return "|".join(names) if names else "<none>"
+from _common import apply_dpi_policy_if_available as _apply_dpi_policy_if_available, flags_to_str
 
 class HudProbe(QWidget):
     def __init__(self):
         super().__init__()
         # Set flags in a version-safe way
-        self.setWindowFlag(Qt.Tool, True)
-        self.setWindowFlag(Qt.FramelessWindowHint, True)
-        self.setWindowFlag(Qt.WindowStaysOnTopHint, True)
+        self.setWindowFlags(self.windowFlags() | Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
 
         self.setObjectName("HudProbe")
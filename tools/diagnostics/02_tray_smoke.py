@@ -3,22 +3,12 @@ import sys
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QGuiApplication, QAction
 from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QStyle, QMenu, QWidget, QLabel
-
-def _apply_dpi_policy_if_available():
-    policy_enum = getattr(Qt, "HighDpiScaleFactorRoundingPolicy", None)
-    setter = getattr(QGuiApplication, "setHighDpiScaleFactorRoundingPolicy", None)
-    if policy_enum is not None and setter is not None:
-        try:
-            setter(policy_enum.PassThrough)
-        except Exception:
-            pass
+from _common import apply_dpi_policy_if_available as _apply_dpi_policy_if_available
 
 class Hud(QWidget):
     def __init__(self):
         super().__init__()
-        self.setWindowFlag(Qt.Tool, True)
-        self.setWindowFlag(Qt.FramelessWindowHint, True)
-        self.setWindowFlag(Qt.WindowStaysOnTopHint, True)
+        self.setWindowFlags(self.windowFlags() | Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         self.setObjectName("TrayHud")
         lab = QLabel("TRAY HUD — Right-click tray to exit", self)
@@ -47,10 +37,14 @@ def main():
 
     hud = Hud()
 
+    def raise_hud():  # built once, reused by every show
+        hud.raise_()
+        hud.activateWindow()
+
     def do_show():
         hud.center_top()
         hud.show()
-        QTimer.singleShot(120, lambda: (hud.raise_(), hud.activateWindow()))
+        QTimer.singleShot(120, raise_hud)
         print("DIAG: HUD show requested from tray.")
 
     show_action.triggered.connect(do_show)
@@ -61,7 +55,6 @@ def main():
 
     tray.setContextMenu(menu)
     tray.setVisible(True)
-    tray.show()
 
     print("DIAG: tray.isSystemTrayAvailable =", QSystemTrayIcon.isSystemTrayAvailable())
     print("DIAG: tray.supportsMessages =", QSystemTrayIcon.supportsMessages())
@@ -3,13 +3,7 @@ import sys, itertools
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QGuiApplication, QAction, QIcon, QPainter, QPixmap, QColor
 from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QStyle, QMenu, QWidget, QLabel
-
-def _apply_dpi_policy_if_available():
-    policy_enum = getattr(Qt, "HighDpiScaleFactorRoundingPolicy", None)
-    setter = getattr(QGuiApplication, "setHighDpiScaleFactorRoundingPolicy", None)
-    if policy_enum is not None and setter is not None:
-        try: setter(policy_enum.PassThrough)
-        except Exception: pass
+from _common import apply_dpi_policy_if_available as _apply_dpi_policy_if_available
 
 def _make_pix(color: QColor) -> QIcon:
     # Make a crisp 20x20 icon so Windows won't drop it as "empty"
@@ -25,9 +19,7 @@ def _make_pix(color: QColor) -> QIcon:
 class Hud(QWidget):
     def __init__(self):
         super().__init__()
-        self.setWindowFlag(Qt.Tool, True)
-        self.setWindowFlag(Qt.FramelessWindowHint, True)
-        self.setWindowFlag(Qt.WindowStaysOnTopHint, True)
+        self.setWindowFlags(self.windowFlags() | Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         lab = QLabel("TRAY PROBE v2 — Right-click tray icon", self)
         lab.setStyleSheet("QLabel { color: white; background: rgba(0,0,0,180); padding: 8px 14px; }")
@@ -63,10 +55,14 @@ def main():
     menu.addSeparator()
     menu.addAction(act_quit)
 
+    def raise_hud():  # built once, reused by every show
+        hud.raise_()
+        hud.activateWindow()
+
     def do_show():
         hud.center_top()
         hud.show()
-        QTimer.singleShot(120, lambda: (hud.raise_(), hud.activateWindow()))
+        QTimer.singleShot(120, raise_hud)
         print("DIAG: HUD show requested from tray.")
 
     def do_bubble():
@@ -81,7 +77,6 @@ def main():
 
     tray.setContextMenu(menu)
     tray.setVisible(True)   # IMPORTANT on Win10/11
-    tray.show()             # belt + suspenders
 
     # Blink the icon so it’s obvious even if overflowed
     cycler = itertools.cycle([ico_a, ico_b])
@@ -1,44 +1,26 @@
 # -*- coding: utf-8 -*-
-import sys, socket
-from contextlib import closing
+import sys
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QAction
-from PySide6.QtWidgets import QApplication, QMainWindow, QTextEdit, QToolBar, QMessageBox, QWidget, QLabel
+from PySide6.QtNetwork import QAbstractSocket, QTcpSocket
+from PySide6.QtWidgets import QApplication, QMainWindow, QPlainTextEdit, QToolBar, QMessageBox, QWidget, QLabel
 from PySide6.QtGui import QGuiApplication
+from _common import apply_dpi_policy_if_available as _apply_dpi_policy_if_available, flags_to_str
+
+# DIAG lines are mirrored to stdout; write without print() and flush when idle
+_OUT = sys.stdout
+_WRITE = _OUT.write
+_FLUSH_IDLE_MS = 100
 
 HOST = "127.0.0.1"
 PORT = 52731
 NUDGE = b"SHOW_OVERLAY_CENTER\n"
-
-def _apply_dpi_policy_if_available():
-    policy_enum = getattr(Qt, "HighDpiScaleFactorRoundingPolicy", None)
-    setter = getattr(QGuiApplication, "setHighDpiScaleFactorRoundingPolicy", None)
-    if policy_enum is not None and setter is not None:
-        try:
-            setter(policy_enum.PassThrough)
-        except Exception:
-            pass
-
-def flags_to_str(f: Qt.WindowType) -> str:
-    names = []
-    for name in [
-        "Tool",
-        "FramelessWindowHint",
-        "WindowStaysOnTopHint",
-        "WindowDoesNotAcceptFocus",
-        "BypassWindowManagerHint",
-        "WindowTransparentForInput",
-    ]:
-        if f & getattr(Qt, name):
-            names.append(name)
-    return "|".join(names) if names else "<none>"
+SOCK_BUF = 65536  # explicit kernel buffers rather than the (small) platform default
 
 class LocalHud(QWidget):
     def __init__(self):
         super().__init__()
-        self.setWindowFlag(Qt.Tool, True)
-        self.setWindowFlag(Qt.FramelessWindowHint, True)
-        self.setWindowFlag(Qt.WindowStaysOnTopHint, True)
+        self.setWindowFlags(self.windowFlags() | Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         self.setObjectName("InstrumentHud")
         lab = QLabel("INSTRUMENT HUD — Compare with your overlay logs", self)
@@ -58,8 +40,13 @@ class Main(QMainWindow):
         self.setWindowTitle("Overlay Instrument")
         self.resize(700, 420)
 
-        self.log = QTextEdit(self)
+        self.log = QPlainTextEdit(self)  # plain, line-based: no rich-text parse per line
         self.log.setReadOnly(True)
+        self.log.setMaximumBlockCount(2000)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_IDLE_MS)
+        self._flush_timer.timeout.connect(_OUT.flush)
         self.setCentralWidget(self.log)
 
         bar = QToolBar("Controls")
@@ -73,15 +60,20 @@ class Main(QMainWindow):
         act_nudge_remote.triggered.connect(self.nudge_remote)
         act_help.triggered.connect(self.help_text)
 
-        bar.addAction(act_show_local)
-        bar.addAction(act_nudge_remote)
-        bar.addAction(act_help)
+        bar.addActions([act_show_local, act_nudge_remote, act_help])
 
         self.local = LocalHud()
+        self._nudge_sock = None  # persistent connection for nudge_remote
+        self._nudge_pending = False  # NUDGE waiting for the connection
+        self._nudge_timer = QTimer(self)  # reply deadline
+        self._nudge_timer.setSingleShot(True)
+        self._nudge_timer.setInterval(800)
+        self._nudge_timer.timeout.connect(self._on_nudge_timeout)
 
     def append(self, s: str):
-        self.log.append(s)
-        print(s)
+        self.log.appendPlainText(s)
+        _WRITE(s + "\n")
+        self._flush_timer.start()  # flush stdout once the log goes quiet
 
     def show_local_hud(self):
         self.append("DIAG: LocalHUD before show "
@@ -90,23 +82,74 @@ class Main(QMainWindow):
         self.local.show()
         self.append("DIAG: LocalHUD after show "
                     f"isVisible={self.local.isVisible()} geom={self.local.geometry().getRect()}")
-        QTimer.singleShot(150, lambda: (self.local.raise_(), self.local.activateWindow(),
-                                        self.append("DIAG: LocalHUD nudge -> raised+activated")))
+        QTimer.singleShot(150, self._raise_local_hud)
+
+    def _raise_local_hud(self):
+        self.local.raise_()
+        self.local.activateWindow()
+        self.append("DIAG: LocalHUD nudge -> raised+activated")
+
+    # ---------- remote nudge (QTcpSocket, driven by the event loop) ----------
+    def _nudge_socket(self) -> QTcpSocket:
+        # One connection reused across clicks; reconnected lazily.
+        if self._nudge_sock is None:
+            sock = QTcpSocket(self)
+            sock.connected.connect(self._on_nudge_connected)
+            sock.readyRead.connect(self._on_nudge_ready_read)
+            sock.errorOccurred.connect(self._on_nudge_error)
+            self._nudge_sock = sock
+        return self._nudge_sock
 
     def nudge_remote(self):
-        try:
-            with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-                s.settimeout(0.8)
-                s.connect((HOST, PORT))
-                s.sendall(NUDGE)
-                data = s.recv(4096)
-                self.append(f"DIAG: Remote reply: {data!r}")
-        except Exception as e:
-            self.append(f"DIAG: Remote nudge failed: {e!r}")
-            QMessageBox.warning(self, "Nudge failed",
-                                "Could not contact your app's overlay endpoint.\n"
-                                "If you do have a socket, point HOST/PORT to it.\n"
-                                "Otherwise, use Local HUD and compare vs 01/02.")
+        sock = self._nudge_socket()
+        self._nudge_pending = True
+        self._nudge_timer.start()
+        if sock.state() == QAbstractSocket.ConnectedState:
+            self._send_nudge()
+        elif sock.state() == QAbstractSocket.UnconnectedState:
+            sock.connectToHost(HOST, PORT)
+        # else: still connecting; _on_nudge_connected sends it
+
+    def _send_nudge(self):
+        self._nudge_pending = False
+        self._nudge_sock.write(NUDGE)
+
+    def _on_nudge_connected(self):
+        # Tiny request/reply: send at once instead of waiting on Nagle
+        sock = self._nudge_sock
+        sock.setSocketOption(QAbstractSocket.LowDelayOption, 1)
+        sock.setSocketOption(QAbstractSocket.SendBufferSizeSocketOption, SOCK_BUF)
+        sock.setSocketOption(QAbstractSocket.ReceiveBufferSizeSocketOption, SOCK_BUF)
+        if self._nudge_pending:
+            self._send_nudge()
+
+    def _on_nudge_ready_read(self):
+        self._nudge_timer.stop()
+        data = bytes(self._nudge_sock.readAll())
+        self.append(f"DIAG: Remote reply: {data!r}")
+
+    def _on_nudge_error(self, _err):
+        if not self._nudge_timer.isActive():
+            return  # e.g. the peer closing an idle connection; reconnect on next click
+        self._nudge_failed(self._nudge_sock.errorString())
+
+    def _on_nudge_timeout(self):
+        self._nudge_failed("no reply within 800 ms")
+
+    def _nudge_failed(self, why: str):
+        self._nudge_timer.stop()
+        self._nudge_pending = False
+        self._nudge_sock.abort()
+        self.append(f"DIAG: Remote nudge failed: {why}")
+        QMessageBox.warning(self, "Nudge failed",
+                            "Could not contact your app's overlay endpoint.\n"
+                            "If you do have a socket, point HOST/PORT to it.\n"
+                            "Otherwise, use Local HUD and compare vs 01/02.")
+
+    def closeEvent(self, e):
+        if self._nudge_sock is not None:
+            self._nudge_sock.abort()
+        super().closeEvent(e)
 
     def help_text(self):
         self.append("Copy these back:\n"
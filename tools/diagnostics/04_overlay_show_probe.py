@@ -4,11 +4,17 @@
 Runs your real Overlay (companion.ui.overlay.Overlay) in isolation.
 Acronyms: GUI = Graphical User Interface, HUD = Heads-Up Display.
 """
-import sys, inspect
+import sys, inspect, functools
 from pathlib import Path
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtWidgets import QApplication, QMainWindow, QTextEdit, QToolBar
+from PySide6.QtCore import Qt, QTimer, QMetaObject, Slot
+from PySide6.QtWidgets import QApplication, QMainWindow, QPlainTextEdit, QToolBar
 from PySide6.QtGui import QAction
+from _common import flags_to_str
+
+# DIAG lines are mirrored to stdout; write without print() and flush when idle
+_OUT = sys.stdout
+_WRITE = _OUT.write
+_FLUSH_IDLE_MS = 100
 
 # --- ensure ProjectRoot/src is on sys.path ---
 HERE = Path(__file__).resolve()
@@ -21,21 +27,14 @@ if str(SRC) not in sys.path:
 from KiCadPartsSyncer.ui.overlay import Overlay
 from KiCadPartsSyncer.infrastructure.system.event_hub import EventHub
 
-def flags_to_str(f):
-    names = []
-    for name in [
-        "Tool", "FramelessWindowHint", "WindowStaysOnTopHint",
-        "WindowTransparentForInput", "BypassWindowManagerHint",
-        "NoDropShadowWindowHint",
-    ]:
-        if f & getattr(Qt, name):
-            names.append(name)
-    return "|".join(names) if names else "<none>"
+@functools.lru_cache(maxsize=None)
+def _param_names(cls):
+    # constructors don't change at runtime; introspect each class once
+    return tuple(inspect.signature(cls.__init__).parameters)
 
 def make_overlay():
     hub = EventHub()
-    sig = inspect.signature(Overlay.__init__)
-    params = list(sig.parameters.keys())  # ['self', ...]
+    params = _param_names(Overlay)  # ('self', ...)
     try:
         if len(params) >= 3:
             return Overlay(hub)   # Overlay(self, hub, settings)
@@ -54,27 +53,39 @@ class Main(QMainWindow):
         self.setWindowTitle("Overlay Show Probe")
         self.resize(820, 480)
 
-        self.log = QTextEdit(self); self.log.setReadOnly(True)
+        self.log = QPlainTextEdit(self); self.log.setReadOnly(True)
+        self.log.setMaximumBlockCount(2000)  # bounded; plain text appends skip rich-text parsing
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_IDLE_MS)
+        self._flush_timer.timeout.connect(_OUT.flush)
         self.setCentralWidget(self.log)
         bar = QToolBar("Controls"); self.addToolBar(bar)
 
         act_show = QAction("Show Overlay (center+raise)", self)
         act_flags = QAction("Log Flags/Geometry", self)
-        bar.addAction(act_show); bar.addAction(act_flags)
+        bar.addActions([act_show, act_flags])
 
         self.overlay = make_overlay()
         # Defensive flags
-        self.overlay.setWindowFlag(Qt.Tool, True)
-        self.overlay.setWindowFlag(Qt.FramelessWindowHint, True)
-        self.overlay.setWindowFlag(Qt.WindowStaysOnTopHint, True)
+        self.overlay.setWindowFlags(self.overlay.windowFlags() | Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.overlay.setAttribute(Qt.WA_TranslucentBackground, True)
 
+        # Screen used for centering, resolved on first show and dropped when
+        # the screen setup changes (see _forget_screen)
+        self._scr = None
+        app = QApplication.instance()
+        app.screenRemoved.connect(self._forget_screen)
+        app.primaryScreenChanged.connect(self._forget_screen)
+
         act_show.triggered.connect(self.show_overlay_center)
         act_flags.triggered.connect(self.dump_state)
-        QTimer.singleShot(50, self.show_overlay_center)
+        # first show once the event loop is running; no need for an arbitrary delay
+        QMetaObject.invokeMethod(self, "show_overlay_center", Qt.QueuedConnection)
 
     def append(self, s: str):
-        self.log.append(s); print(s)
+        self.log.appendPlainText(s); _WRITE(s + "\n")
+        self._flush_timer.start()  # flush stdout once the log goes quiet
 
     def dump_state(self):
         self.append(f"DIAG: overlay state -> isVisible={self.overlay.isVisible()} "
@@ -82,10 +93,17 @@ class Main(QMainWindow):
                     f"geom={self.overlay.geometry().getRect()} "
                     f"flags={flags_to_str(self.overlay.windowFlags())}")
 
+    def _forget_screen(self, _screen=None):
+        self._scr = None
+
+    @Slot()
     def show_overlay_center(self):
-        scr = self.overlay.screen() or self.screen()
+        scr = self._scr
+        if scr is None:
+            scr = self._scr = self.overlay.screen() or self.screen()
         geo = scr.availableGeometry() if scr else self.geometry()
-        w, h = max(420, self.overlay.width()), max(28, self.overlay.height())
+        sz = self.overlay.size()
+        w, h = max(420, sz.width()), max(28, sz.height())
         x = geo.x() + (geo.width() - w) // 2
         y = geo.y() + int(geo.height() * 0.05)
         self.overlay.setGeometry(x, y, w, h)
@@ -93,12 +111,13 @@ class Main(QMainWindow):
         self.append("DIAG: before show -> "
                     f"isVisible={self.overlay.isVisible()} flags={flags_to_str(self.overlay.windowFlags())}")
         self.overlay.show()
-        QTimer.singleShot(120, lambda: (
-            self.overlay.raise_(),
-            self.overlay.activateWindow(),
-            self.append("DIAG: nudge -> raised+activated"),
-            self.dump_state()
-        ))
+        QTimer.singleShot(120, self._raise_overlay)
+
+    def _raise_overlay(self):
+        self.overlay.raise_()
+        self.overlay.activateWindow()
+        self.append("DIAG: nudge -> raised+activated")
+        self.dump_state()
 
 def main():
     app = QApplication(sys.argv)
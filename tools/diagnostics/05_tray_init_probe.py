@@ -22,26 +22,26 @@ from KiCadPartsSyncer.ui.tray import Tray
 from KiCadPartsSyncer.infrastructure.system.event_hub import EventHub
 
 def build_overlay():
+    # Only allocate an EventHub when the no-arg constructor is rejected
     try:
-        return Overlay(hub)
+        return Overlay(), None
     except TypeError:
-        return Overlay()
+        hub = EventHub()
+        return Overlay(hub), hub
 
 def main():
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
 
-    overlay = build_overlay()
-    overlay.setWindowFlag(Qt.Tool, True)
-    overlay.setWindowFlag(Qt.FramelessWindowHint, True)
-    overlay.setWindowFlag(Qt.WindowStaysOnTopHint, True)
+    overlay, hub = build_overlay()
+    overlay.setWindowFlags(overlay.windowFlags() | Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
     overlay.setAttribute(Qt.WA_TranslucentBackground, True)
 
     # Always create a guaranteed visible tray first
-    base_tray = QSystemTrayIcon()
-    icon = app.style().standardIcon(QStyle.SP_MessageBoxInformation)
-    base_tray.setIcon(icon); base_tray.setToolTip("Base Tray Sanity")
-    base_tray.setVisible(True); base_tray.show()
+    icon = app.style().standardIcon(QStyle.SP_MessageBoxInformation)  # built once, shared by both trays
+    base_tray = QSystemTrayIcon(icon)
+    base_tray.setToolTip("Base Tray Sanity")
+    base_tray.setVisible(True)
     print("DIAG: base_tray.isVisible =", base_tray.isVisible())
 
     # Build your Tray; adapt to its constructor variants
@@ -51,26 +51,40 @@ def main():
         try:
             t = Tray(overlay)
         except TypeError:
-            t = Tray(EventHub(), overlay)
+            t = Tray(hub or EventHub(), overlay)
 
     tray = getattr(t, "tray", None)
     if not isinstance(tray, QSystemTrayIcon):
-        tray = QSystemTrayIcon()
-        tray.setIcon(icon); tray.setToolTip("Tray Init Probe")
-        tray.setVisible(True); tray.show()
+        tray = QSystemTrayIcon(icon)
+        tray.setToolTip("Tray Init Probe")
+        tray.setVisible(True)
 
     from PySide6.QtWidgets import QMenu
     menu = getattr(t, "menu", None) or QMenu()
     show_act = QAction("Show Overlay (center)")
     quit_act = QAction("Quit")
+    # Centering screen, resolved on first show; dropped when screens change
+    cached = {"scr": None}
+    def forget_screen(_screen=None):
+        cached["scr"] = None
+    app.screenRemoved.connect(forget_screen)
+    app.primaryScreenChanged.connect(forget_screen)
+
+    def raise_overlay():  # built once, reused by every show
+        overlay.raise_()
+        overlay.activateWindow()
+
     def center_show_overlay():
-        scr = overlay.screen() or app.primaryScreen()
+        scr = cached["scr"]
+        if scr is None:
+            scr = cached["scr"] = overlay.screen() or app.primaryScreen()
         geo = scr.availableGeometry()
-        w, h = max(420, overlay.width()), max(28, overlay.height())
+        sz = overlay.size()
+        w, h = max(420, sz.width()), max(28, sz.height())
         x = geo.x() + (geo.width() - w)//2; y = geo.y() + int(geo.height()*0.05)
         overlay.setGeometry(x, y, w, h)
         overlay.show()
-        QTimer.singleShot(120, lambda: (overlay.raise_(), overlay.activateWindow()))
+        QTimer.singleShot(120, raise_overlay)
         print("DIAG: overlay show requested from tray")
 
     show_act.triggered.connect(lambda: QTimer.singleShot(0, center_show_overlay))
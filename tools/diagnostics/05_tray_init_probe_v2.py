@@ -4,7 +4,7 @@
 Builds your real Tray with the correct constructor args (by name), guarantees a visible QSystemTrayIcon,
 and adds a "Show Overlay (center)" action that runs on the GUI (Graphical User Interface) thread.
 """
-import sys, inspect
+import sys, inspect, functools
 from pathlib import Path
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QStyle, QMenu
@@ -22,52 +22,64 @@ from KiCadPartsSyncer.ui.tray import Tray
 from KiCadPartsSyncer.infrastructure.system.event_hub import EventHub
 
 def build_overlay_and_env(app: QApplication):
-    hub = EventHub()
-    # Try Overlay(hub, settings) then Overlay(settings)
-    try:
-        overlay = Overlay(hub)
-    except TypeError:
-        overlay = Overlay()
+    # Only allocate an EventHub when the Overlay constructor takes one
+    hub = EventHub() if "hub" in _param_names(Overlay) else None
+    overlay = Overlay(hub) if hub is not None else Overlay()
     # Defensive flags for HUD behavior
-    overlay.setWindowFlag(Qt.Tool, True)
-    overlay.setWindowFlag(Qt.FramelessWindowHint, True)
-    overlay.setWindowFlag(Qt.WindowStaysOnTopHint, True)
+    overlay.setWindowFlags(overlay.windowFlags() | Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
     overlay.setAttribute(Qt.WA_TranslucentBackground, True)
-    return overlay, hub
+    return overlay, None, hub  # no settings object in this tree
+
+@functools.lru_cache(maxsize=None)
+def _param_names(cls):
+    # constructors don't change at runtime; introspect each class once
+    return tuple(inspect.signature(cls.__init__).parameters)
 
 def make_tray(app: QApplication, overlay, settings, hub):
     # Map ctor args by parameter name to avoid ordering issues
-    sig = inspect.signature(Tray.__init__)
-    names = list(sig.parameters.keys())  # includes 'self'
-    kwargs = {}
-    if "app" in names:      kwargs["app"] = app
-    if "overlay" in names:  kwargs["overlay"] = overlay
-    if "settings" in names: kwargs["settings"] = settings
-    if "hub" in names:      kwargs["hub"] = hub
-    return Tray(**kwargs)
-
-def center_show_overlay(app, overlay):
-    scr = overlay.screen() or app.primaryScreen()
+    names = _param_names(Tray)  # includes 'self'
+    if hub is None and "hub" in names:
+        hub = EventHub()
+    candidates = (("app", app), ("overlay", overlay), ("settings", settings), ("hub", hub))
+    return Tray(**{n: v for n, v in candidates if n in names})
+
+# Centering screen, resolved on first show; dropped when screens change
+_cached_screen = None
+
+def _forget_screen(_screen=None):
+    global _cached_screen
+    _cached_screen = None
+
+def _raise_and_activate(w):
+    w.raise_()
+    w.activateWindow()
+
+def center_show_overlay(app, overlay, raise_overlay):
+    global _cached_screen
+    scr = _cached_screen
+    if scr is None:
+        scr = _cached_screen = overlay.screen() or app.primaryScreen()
     geo = scr.availableGeometry()
-    w, h = max(420, overlay.width()), max(28, overlay.height())
+    sz = overlay.size()
+    w, h = max(420, sz.width()), max(28, sz.height())
     x = geo.x() + (geo.width() - w)//2
     y = geo.y() + int(geo.height()*0.05)
     overlay.setGeometry(x, y, w, h)
     overlay.show()
-    QTimer.singleShot(120, lambda: (overlay.raise_(), overlay.activateWindow()))
+    QTimer.singleShot(120, raise_overlay)
     print("DIAG: overlay show requested from tray")
 
 def main():
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
+    app.screenRemoved.connect(_forget_screen)
+    app.primaryScreenChanged.connect(_forget_screen)
 
     # Base sanity tray to ensure an icon is visible regardless of your Tray internals
-    base_tray = QSystemTrayIcon()
-    icon = app.style().standardIcon(QStyle.SP_MessageBoxInformation)
-    base_tray.setIcon(icon)
+    icon = app.style().standardIcon(QStyle.SP_MessageBoxInformation)  # built once, shared by both trays
+    base_tray = QSystemTrayIcon(icon)
     base_tray.setToolTip("Base Tray Sanity")
     base_tray.setVisible(True)
-    base_tray.show()
     print("DIAG: base_tray.isVisible =", base_tray.isVisible())
 
     overlay, settings, hub = build_overlay_and_env(app)
@@ -78,11 +90,9 @@ def main():
     # Get underlying QSystemTrayIcon or make one
     tray = getattr(t, "tray", None)
     if not isinstance(tray, QSystemTrayIcon):
-        tray = QSystemTrayIcon()
-        tray.setIcon(icon)
+        tray = QSystemTrayIcon(icon)
         tray.setToolTip("Tray Init Probe v2")
         tray.setVisible(True)
-        tray.show()
 
     # Use your tray's menu if exposed; else our own
     menu = getattr(t, "menu", None)
@@ -92,7 +102,10 @@ def main():
     act_show = QAction("Show Overlay (center)")
     act_quit = QAction("Quit")
 
-    act_show.triggered.connect(lambda: QTimer.singleShot(0, lambda: center_show_overlay(app, overlay)))
+    # Both callables are bound once here instead of rebuilt on every click
+    raise_overlay = functools.partial(_raise_and_activate, overlay)
+    show_centered = functools.partial(center_show_overlay, app, overlay, raise_overlay)
+    act_show.triggered.connect(lambda: QTimer.singleShot(0, show_centered))
     act_quit.triggered.connect(app.quit)
 
     menu.addAction(act_show)
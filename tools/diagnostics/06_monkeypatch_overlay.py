@@ -8,89 +8,46 @@
 Run:
     python tools/diagnostics/06_monkeypatch_overlay.py
 """
-import sys, runpy
-from pathlib import Path
-from PySide6.QtCore import Qt, QTimer
+import sys
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QStyle, QMenu
-
-HERE = Path(__file__).resolve()
-PROJECT_ROOT = HERE.parents[2]
-SRC = PROJECT_ROOT / "src"
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
-
-# Import target class to patch
-from KiCadPartsSyncer.ui.overlay import Overlay  # noqa: E402
+from _common import run_as_main
+from _overlay_show_common import PROJECT_ROOT, ensure_timers, install_show_patch, live_overlays
 
 # -------- Overlay.show patch --------
-_orig_show = Overlay.show
-
-def _flags_to_str(f):
-    names = []
-    for name in [
-        "Tool", "FramelessWindowHint", "WindowStaysOnTopHint",
-        "WindowTransparentForInput", "BypassWindowManagerHint",
-        "WindowTransparentForInput", "NoDropShadowWindowHint",
-    ]:
-        if f & getattr(Qt, name):
-            names.append(name)
-    return "|".join(names) if names else "<none>"
-
 def _center_on_active_screen(w):
     app = QApplication.instance()
     scr = (w.screen() or (app.primaryScreen() if app else None))
     if scr:
         geo = scr.availableGeometry()
-        W = max(420, w.width())
-        H = max(28,  w.height())
+        sz = w.size()
+        W = max(420, sz.width())
+        H = max(28,  sz.height())
         x = geo.x() + (geo.width()  - W) // 2
         y = geo.y() + int(geo.height() * 0.05)
         w.setGeometry(x, y, W, H)
 
-def _patched_show(self):
-    print(f"DIAG: Overlay.show intercepted -> isVisible={self.isVisible()} "
-          f"flags={_flags_to_str(self.windowFlags())}")
-    def _do():
-        self.setWindowFlag(Qt.Tool, True)
-        self.setWindowFlag(Qt.FramelessWindowHint, True)
-        self.setWindowFlag(Qt.WindowStaysOnTopHint, True)
-        self.setAttribute(Qt.WA_TranslucentBackground, True)
-        _center_on_active_screen(self)
-
-        print("DIAG: Overlay.show -> applying flags & centering, then QWidget.show()")
-        _orig_show(self)
-        QTimer.singleShot(120, lambda: (
-            self.raise_(),
-            self.activateWindow(),
-            print(f"DIAG: Overlay after show -> isVisible={self.isVisible()} "
-                  f"geom={self.geometry().getRect()} flags={_flags_to_str(self.windowFlags())}")
-        ))
-    QTimer.singleShot(0, _do)  # force onto GUI thread
-
-Overlay.show = _patched_show  # runtime patch
+install_show_patch(_center_on_active_screen)
 
 # -------- Install diagnostics tray AFTER QApplication exists --------
 _orig_qapp_init = QApplication.__init__
 _tray_installed = {"done": False}
 
 def _install_diag_tray(app: QApplication):
-    if _tray_installed["done"]:
-        return
     tray = QSystemTrayIcon()
     tray.setIcon(app.style().standardIcon(QStyle.SP_MessageBoxInformation))
     tray.setToolTip("HUD Diagnostics")
-    tray.setVisible(True); tray.show()
+    tray.setVisible(True)
 
     menu = QMenu()
     act_show = QAction("Show HUD (center)")
     act_quit = QAction("Quit App")
 
     def _show_any_overlay():
-        # Call show() on any Overlay top-level widgets (uses our patched show)
-        for w in app.topLevelWidgets():
-            if isinstance(w, Overlay):
-                w.show()
+        # Call show() on every live Overlay (uses our patched show)
+        for w in live_overlays():
+            w.show()
         print("DIAG: tray -> requested Overlay.show()")
 
     act_show.triggered.connect(lambda: QTimer.singleShot(0, _show_any_overlay))
@@ -98,10 +55,15 @@ def _install_diag_tray(app: QApplication):
     menu.addAction(act_show); menu.addSeparator(); menu.addAction(act_quit)
     tray.setContextMenu(menu)
     print("DIAG: diag tray installed; tray.isVisible =", tray.isVisible())
-    _tray_installed["done"] = True
 
 def _patched_qapp_init(self, *args, **kwargs):
     _orig_qapp_init(self, *args, **kwargs)
+    ensure_timers()
+    if _tray_installed["done"]:
+        return
+    # Claim the install now, not when the deferred call fires, so a second
+    # QApplication constructed before the next event-loop turn can't queue another
+    _tray_installed["done"] = True
     # Install tray on the next event-loop turn so widgets can register
     QTimer.singleShot(0, lambda: _install_diag_tray(self))
 
@@ -114,4 +76,4 @@ if not RUN.exists():
     sys.exit(1)
 
 print("DIAG: launching real app via run.py ...")
-runpy.run_path(str(RUN), run_name="__main__")
+run_as_main(RUN)
@@ -55,13 +55,13 @@ def main():
     overlay = Overlay(hub=DummyHub(), settings=DummySettings())
 
     print("\n[09] Initial sizes before show():")
-    print("  window:", overlay.size(), "root:", overlay._body.size())
+    print("  window:", overlay.size(), "card:", overlay._card.size())
 
     overlay.show_overlay()
     app.processEvents()
 
     print("\n[09] After show_overlay() + processEvents():")
-    print("  window:", overlay.size(), "root:", overlay._body.size())
+    print("  window:", overlay.size(), "card:", overlay._card.size())
 
     print("\n→ Try hiding/re-showing manually to confirm visual repaint behavior.\n")
     overlay.flash()
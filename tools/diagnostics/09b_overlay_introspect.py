@@ -5,7 +5,7 @@ Quick helper to list private attributes of Overlay
 so we can see what the internal HUD container is named.
 """
 
-import sys
+import re, sys
 from pathlib import Path
 from PySide6.QtWidgets import QApplication
 
@@ -28,9 +28,11 @@ class DummySettings:
 app = QApplication([])
 o = Overlay(None, DummySettings())
 
+# Layout attributes are set in __init__, so the instance dict is enough; no
+# need to walk dir() and its Qt-inherited names.
+_CONTAINER_NAME = re.compile(r"frame|root|widget|body|container")
+
 print("\nOverlay attributes (private ones only):")
-for name in dir(o):
-    if not name.startswith("_"):
-        continue
-    if any(key in name for key in ("frame", "root", "widget", "body", "container")):
+for name in vars(o):
+    if name.startswith("_") and _CONTAINER_NAME.search(name):
         print("   ", name)
@@ -33,6 +33,10 @@ from KiCadPartsSyncer.ui.overlay import Overlay  # type: ignore
 class Flags:
     force_geom: bool = False
 
+# paintEvent fires on every repaint; log only the first-show window
+_LOG_BUDGET = 32
+_LOG_FMT = "[10] t={:7.2f}ms {:>18}: window={} body={}{}"
+
 def parse_flags() -> Flags:
     return Flags(force_geom=("--force-geom" in sys.argv))
 
@@ -43,7 +47,7 @@ class DummySettings:
     def save(self): pass
 
 def pick_body_attr(obj) -> str | None:
-    for name in ("_body", "_root", "_frame", "_container", "_widget", "_content"):
+    for name in ("_card", "_body", "_root", "_frame", "_container", "_widget", "_content"):
         if hasattr(obj, name):
             return name
     return None
@@ -57,7 +61,8 @@ class InstrumentedOverlay(Overlay):
         super().__init__(*a, **kw)
 
         self._flags: Flags = flags if isinstance(flags, Flags) else Flags()
-        self._t0 = time.perf_counter()
+        self._t0_ns = time.perf_counter_ns()
+        self._log_budget = _LOG_BUDGET
         self._body_name = pick_body_attr(self)
         self._body_ref = getattr(self, self._body_name) if self._body_name else None
         self._forced = False
@@ -72,15 +77,20 @@ class InstrumentedOverlay(Overlay):
 
     # Logging utilities
     def _dt(self) -> float:
-        return (time.perf_counter() - self._t0) * 1000.0
+        return (time.perf_counter_ns() - self._t0_ns) / 1e6
     def _sizes(self):
         win_sz = self.size()
         body_sz = self._body_ref.size() if self._body_ref is not None else None
         return win_sz, body_sz
     def _log_sizes(self, where: str):
+        budget = self._log_budget
+        if budget <= 0:
+            return
+        self._log_budget = budget - 1
         win_sz, body_sz = self._sizes()
-        forced = " forced" if self._forced else ""
-        print(f"[10] t={self._dt():7.2f}ms {where:>18}: window={win_sz} body={body_sz}{forced}")
+        print(_LOG_FMT.format(self._dt(), where, win_sz, body_sz, " forced" if self._forced else ""))
+        if budget == 1:
+            print(f"[10] log budget ({_LOG_BUDGET} lines) used up; further size logs suppressed")
 
     # Qt events
     def showEvent(self, e):
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers shared by the diagnostic scripts in this folder.
+
+Scripts run as `python tools/diagnostics/<script>.py`, so this folder is on
+sys.path and they can simply `from _common import ...`.
+"""
+import atexit
+import functools
+import sys
+import threading
+
+from PySide6.QtCore import QCoreApplication, QMetaObject, QTimer, Qt
+from PySide6.QtGui import QGuiApplication
+
+# (bit, name) for the window flags the diagnostics care about, resolved once
+_FLAG_TABLE = tuple(
+    (int(getattr(Qt, name)), name)
+    for name in (
+        "Tool",
+        "FramelessWindowHint",
+        "WindowStaysOnTopHint",
+        "WindowDoesNotAcceptFocus",
+        "BypassWindowManagerHint",
+        "WindowTransparentForInput",
+        "NoDropShadowWindowHint",
+        "X11BypassWindowManagerHint",
+    )
+    if hasattr(Qt, name)
+)
+
+
+def apply_dpi_policy_if_available():
+    policy_enum = getattr(Qt, "HighDpiScaleFactorRoundingPolicy", None)
+    setter = getattr(QGuiApplication, "setHighDpiScaleFactorRoundingPolicy", None)
+    if policy_enum is not None and setter is not None:
+        try:
+            setter(policy_enum.PassThrough)
+        except Exception:
+            pass
+
+
+def flags_to_str(f) -> str:
+    bits = int(f)
+    return "|".join(name for bit, name in _FLAG_TABLE if bits & bit) or "<none>"
+
+
+# ---------- screen geometry cache ----------
+_screen_rects = {}  # QScreen -> (x, y, right, bottom) of its available geometry
+_screens_hooked = False
+
+
+def _forget_screen_rects(*_):
+    _screen_rects.clear()
+
+
+def _hook_screen(scr):
+    scr.availableGeometryChanged.connect(_forget_screen_rects)
+
+
+def available_rect(scr):
+    """(x, y, right, bottom) of scr.availableGeometry(), cached until screens change."""
+    global _screens_hooked
+    r = _screen_rects.get(scr)
+    if r is None:
+        if not _screens_hooked:
+            app = QGuiApplication.instance()
+            for sig in (app.screenAdded, app.screenRemoved, app.primaryScreenChanged):
+                sig.connect(_forget_screen_rects)
+            app.screenAdded.connect(_hook_screen)
+            for s in app.screens():
+                _hook_screen(s)
+            _screens_hooked = True
+        g = scr.availableGeometry()
+        r = _screen_rects[scr] = (g.x(), g.y(), g.right(), g.bottom())
+    return r
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled(path: str):
+    with open(path, "rb") as fh:
+        return compile(fh.read(), path, "exec")
+
+
+def run_as_main(path) -> None:
+    """Execute a script as __main__ (like runpy.run_path), parsing it once per process."""
+    path = str(path)
+    exec(_compiled(path), {"__name__": "__main__", "__file__": path})
+
+
+# ---------- buffered DIAG output ----------
+# Event taps can log from any thread at a high rate; collect lines and write
+# them in one go shortly after, on the GUI thread (and once more at exit).
+_LOG_FLUSH_MS = 100
+_log_buf = []
+_log_armed = False
+_log_lock = threading.Lock()
+_log_timer = None
+
+
+def _flush_log() -> None:
+    global _log_buf, _log_armed
+    with _log_lock:
+        lines, _log_buf = _log_buf, []
+        _log_armed = False
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def buffered_print(msg: str) -> None:
+    """print() replacement that batches lines for up to _LOG_FLUSH_MS."""
+    global _log_armed, _log_timer
+    with _log_lock:
+        _log_buf.append(msg)
+        if _log_armed:
+            return
+        app = QCoreApplication.instance()
+        if app is None:
+            return  # no event loop yet; a later line (or exit) flushes
+        _log_armed = True
+        t = _log_timer
+        if t is None:
+            t = _log_timer = QTimer()
+            t.setSingleShot(True)
+            t.setInterval(_LOG_FLUSH_MS)
+            t.timeout.connect(_flush_log)
+            t.moveToThread(app.thread())
+    # queued start(): runs on the GUI thread whichever thread logged
+    QMetaObject.invokeMethod(t, "start", Qt.QueuedConnection)
+
+
+atexit.register(_flush_log)
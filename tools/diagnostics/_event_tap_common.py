@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+"""
+_event_tap_common.py
+Shared EventHub tap behind the 07_* and 08_* auto-show launchers:
+- Registers live Overlay instances as they are constructed.
+- install_tap(...) wraps EventHub.publish WITHOUT changing its signature, logs
+  trigger events (every publish with KCPS_DIAG=1) and schedules Overlay.show()
+  on the GUI thread when a trigger name is seen.
+- launch() runs the real app (run.py) in-process so the patches stay active.
+
+Acronyms: GUI = Graphical User Interface, HUD = Heads-Up Display.
+"""
+import os, sys, time, json, dataclasses, inspect
+from pathlib import Path
+from weakref import WeakSet
+from PySide6.QtCore import QObject, QMetaObject, QTimer, Signal, Slot, Qt
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QCursor, QGuiApplication
+from _common import available_rect, buffered_print as _log, run_as_main
+
+# ---- ensure src on sys.path ----
+HERE = Path(__file__).resolve()
+PROJECT_ROOT = HERE.parents[2]
+SRC = PROJECT_ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+# ---- import your classes AFTER path fix ----
+from KiCadPartsSyncer.infrastructure.system.event_hub import EventHub  # noqa: E402
+from KiCadPartsSyncer.ui.overlay import Overlay  # noqa: E402
+
+RUN = PROJECT_ROOT / "run.py"
+
+ACTIVE_MONITORING_NAMES = frozenset({
+    "enter_active_monitoring",
+    "ActiveMonitoring", "EnterActiveMonitoring",
+    "state_active_monitoring", "entered_active_monitoring",
+})
+ENDPOINT_NAMES = frozenset({"EndpointAppeared", "endpoint_appeared"})  # include the one we saw
+
+# Logging every publish is opt-in (KCPS_DIAG=1); trigger events are always
+# logged. Non-trigger events otherwise skip the JSON/f-string work entirely.
+_DIAG_ENABLED = os.environ.get("KCPS_DIAG") == "1"
+
+# ---- registry of live Overlay instances (filled at construction) ----
+_orig_overlay_init = Overlay.__init__
+_overlays = WeakSet()
+_overlay_single = None  # the Overlay, while exactly one has been created (the usual case)
+
+def _forget_single_overlay(*_):
+    global _overlay_single
+    _overlay_single = None  # fall back to the registry; never show() a deleted widget
+
+def _patched_overlay_init(self, *args, **kwargs):
+    global _overlay_single
+    _orig_overlay_init(self, *args, **kwargs)
+    _overlays.add(self)
+    _overlay_single = self if len(_overlays) == 1 else None
+    self.destroyed.connect(_forget_single_overlay)
+
+Overlay.__init__ = _patched_overlay_init  # runtime patch
+
+# ---- helper: show all Overlay instances on the GUI thread ----
+def _show_any_overlay():
+    n = 0
+    o = _overlay_single
+    for w in ((o,) if o is not None else list(_overlays)):
+        try:
+            w.show()   # if you've patched Overlay.show earlier, it will center/raise
+            n += 1
+        except Exception as e:
+            _log(f"DIAG: auto-show -> exception calling show(): {e!r}")
+    _log(f"DIAG: auto-show -> requested show() on {n} Overlay instance(s)")
+
+# ---- show scheduling: direct, delayed (coalescing) or via the GUI invoker ----
+def _schedule_show():
+    # Always hop to GUI thread. The usual single Overlay gets its show() slot
+    # queued directly; otherwise sweep the registry on the next loop turn.
+    o = _overlay_single
+    if o is not None:
+        QMetaObject.invokeMethod(o, "show", Qt.QueuedConnection)
+        _log("DIAG: auto-show -> queued show() on the registered Overlay")
+    else:
+        QTimer.singleShot(0, _show_any_overlay)
+
+_show_timer = None  # one re-armable timer: a burst of triggers yields a single show
+
+def _schedule_show_delayed(delay_ms):
+    global _show_timer
+    app = QApplication.instance()
+    if not app:
+        return
+    t = _show_timer
+    if t is None:
+        t = QTimer()
+        t.setSingleShot(True)
+        t.setInterval(delay_ms)
+        t.timeout.connect(_show_any_overlay)
+        t.moveToThread(app.thread())  # publish may run off the GUI thread
+        _show_timer = t
+    # queued start() (re)arms on the GUI thread, restarting any pending deadline
+    QMetaObject.invokeMethod(t, "start", Qt.QueuedConnection)
+
+class _GuiInvoker(QObject):
+    run = Signal(object)  # emits a callable
+
+    def __init__(self):
+        super().__init__()
+        # Ensure queued delivery into the GUI thread
+        self.run.connect(self._run, Qt.QueuedConnection)
+
+    @Slot(object)
+    def _run(self, fn):
+        try:
+            fn()
+        except Exception as e:
+            _log(f"DIAG: GuiInvoker caught: {e!r}")
+
+_gui = {"invoker": None, "show_pending": False}
+
+def _invoker():
+    # Built on first use and moved to the app's thread, so the queued slot
+    # runs on the GUI thread without patching QApplication.__init__
+    inv = _gui["invoker"]
+    if inv is None:
+        app = QApplication.instance()
+        if app is None:
+            return None
+        inv = _GuiInvoker()
+        inv.moveToThread(app.thread())
+        _gui["invoker"] = inv
+        _log("DIAG: GuiInvoker installed (queued to GUI thread).")
+    return inv
+
+def _emit_gui(fn) -> bool:
+    inv = _invoker()
+    if inv is None:
+        # Called before QApplication exists; nothing to marshal onto yet
+        _log("DIAG: GuiInvoker not ready; skipping.")
+        return False
+    inv.run.emit(fn)
+    return True
+
+def _show_any_overlay_gui():
+    _gui["show_pending"] = False
+    _show_any_overlay()
+
+def _request_show():
+    # The usual single Overlay: queue its show() slot directly, no invoker hop
+    o = _overlay_single
+    if o is not None:
+        QMetaObject.invokeMethod(o, "show", Qt.QueuedConnection)
+        return
+    # Otherwise collapse a burst of triggers into one queued sweep
+    if _gui["show_pending"]:
+        return
+    _gui["show_pending"] = _emit_gui(_show_any_overlay_gui)
+
+# ---- optional fix for show_overlay cursor path (safe if unused) ----
+def _patched_show_overlay(self):
+    try:
+        pos = QCursor.pos()
+    except Exception:
+        pos = None
+    # place near cursor if possible, then rely on show() to raise/activate
+    if pos is not None and hasattr(QGuiApplication, "screenAt") and callable(QGuiApplication.screenAt):
+        scr = QGuiApplication.screenAt(pos)
+        if scr is not None:
+            gx, gy, gr, gb = available_rect(scr)
+            w = max(420, self.width()); h = max(28, self.height())
+            x = max(gx, min(gr - w + 1, pos.x() - w // 2))
+            y = max(gy, min(gb - h + 1, pos.y() + 20))
+            self.setGeometry(x, y, w, h)
+    self.show()
+
+# ---- payload encoding ----
+# Optional C encoder; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_default(o):
+    # Shallow field dict; nested dataclasses come back through this hook,
+    # so there is no deep copy as with dataclasses.asdict().
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return {f.name: getattr(o, f.name) for f in dataclasses.fields(o)}
+    raise TypeError(f"{type(o).__name__} is not JSON serializable")
+
+if orjson is not None:
+    def _json_dumps(obj):
+        return orjson.dumps(obj, default=_json_default).decode()
+else:
+    def _json_dumps(obj):
+        return json.dumps(obj, default=_json_default)
+
+def _safe_json(obj):
+    try:
+        return _json_dumps(obj)
+    except Exception:
+        return "<non-serializable>"
+
+# ---- name extraction for arbitrary event objects ----
+# Event type -> attribute that holds its readable name (None: use the class
+# name). Event types have a fixed shape, so the probing runs once per type.
+_NAME_ATTR_CACHE = {}
+
+def _event_name_from_args(args, kwargs):
+    # Common patterns: publish(event_obj), publish("name"), publish(event=...)
+    return _event_name(args[0] if args else kwargs.get("event"))
+
+def _event_name(ev):
+    if isinstance(ev, str):
+        return ev
+
+    cls = type(ev)
+    try:
+        attr = _NAME_ATTR_CACHE[cls]
+    except KeyError:
+        attr = None
+        for key in ("name", "event", "type", "state"):
+            val = getattr(ev, key, None)
+            if isinstance(val, str) and val:
+                attr = key
+                break
+        _NAME_ATTR_CACHE[cls] = attr
+
+    if attr is not None:
+        val = getattr(ev, attr, None)
+        if isinstance(val, str) and val:
+            return val
+    return cls.__name__
+
+# ---- event tap ----
+def install_tap(*, active_match, endpoint_match=(), schedule_delay_ms=0,
+                use_invoker=False, patch_show_overlay=True):
+    """Wrap EventHub.publish so trigger events auto-show the Overlay.
+
+    active_match / endpoint_match: event names that trigger a show (any casing).
+    schedule_delay_ms: > 0 coalesces a burst of triggers on one timer with that delay.
+    use_invoker: marshal the show through a queued-signal GUI invoker instead.
+    patch_show_overlay: also place Overlay.show_overlay() near the cursor.
+    """
+    # Exact names hit first; otherwise one lower() (only for names of a matching
+    # length) against the lowercased forms, so any casing of a trigger matches.
+    trigger_exact = frozenset(active_match) | frozenset(endpoint_match)
+    trigger_lower = frozenset(n.lower() for n in trigger_exact)
+    trigger_lens = frozenset(map(len, trigger_lower))
+
+    def _is_trigger(name):
+        return name in trigger_exact or (
+            isinstance(name, str) and len(name) in trigger_lens and name.lower() in trigger_lower)
+
+    if use_invoker:
+        schedule, action = _request_show, "emitting to GUI invoker."
+    elif schedule_delay_ms:
+        schedule = lambda: _schedule_show_delayed(schedule_delay_ms)
+        action = f"scheduling Overlay.show() ({schedule_delay_ms}ms)"
+    else:
+        schedule, action = _schedule_show, "scheduling Overlay.show()"
+
+    # Publish lines carry integer time.monotonic_ns() stamps (no float formatting);
+    # this one line maps them back to wall-clock time.
+    t0_wall, t0_mono = time.time(), time.monotonic_ns()
+    print(f"DIAG: tap clock -> ts is monotonic_ns; mono={t0_mono} at wall={t0_wall:.3f}")
+
+    # Trigger names are few, so each one's tap line is formatted once and reused
+    trigger_msgs = {}
+
+    def _report(name, trigger, payload_repr):
+        _log(f"DIAG: EventHub.publish -> {name} payload={payload_repr} ts={time.monotonic_ns()}")
+        if trigger:
+            msg = trigger_msgs.get(name)
+            if msg is None:
+                msg = trigger_msgs[name] = f"DIAG: EventHub tap -> trigger on '{name}'; {action}"
+            _log(msg)
+            schedule()
+
+    # The wrapper's shape is picked once from the original signature: a plain
+    # positional publish gets a matching wrapper with no *args/**kwargs packing
+    # per call; anything else gets the generic signature-preserving one.
+    orig = EventHub.publish
+    try:
+        params = tuple(inspect.signature(orig).parameters.values())
+    except (TypeError, ValueError):
+        params = ()
+    positional = all(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in params)
+    shape = tuple(p.name for p in params) if positional else None
+
+    # _orig as a default argument: a local lookup instead of a closure one per publish
+    if shape == ("self", "evt") and params[1].default is inspect.Parameter.empty:
+        def _publish_tap(self, evt, _orig=orig):
+            name = _event_name(evt)
+            trigger = _is_trigger(name)
+            if _DIAG_ENABLED or trigger:
+                _report(name, trigger, None)
+            return _orig(self, evt)
+    elif shape == ("self", "event_name", "payload") and params[2].default is None:
+        def _publish_tap(self, event_name, payload=None, _orig=orig):
+            name = _event_name(event_name)
+            trigger = _is_trigger(name)
+            if _DIAG_ENABLED or trigger:
+                _report(name, trigger, None if payload is None else _safe_json(payload))
+            return _orig(self, event_name, payload)
+    else:
+        def _publish_tap(self, *args, _orig=orig, **kwargs):
+            name = _event_name_from_args(args, kwargs)
+            trigger = _is_trigger(name)
+            if not (_DIAG_ENABLED or trigger):
+                # pass-through: forward positionals only unless kwargs were given
+                return _orig(self, *args, **kwargs) if kwargs else _orig(self, *args)
+
+            # Best-effort payload peek (don’t assume shape)
+            payload_repr = None
+            if len(args) >= 2:
+                payload_repr = _safe_json(args[1])
+            elif "payload" in kwargs:
+                payload_repr = _safe_json(kwargs["payload"])
+            _report(name, trigger, payload_repr)
+            return _orig(self, *args, **kwargs)
+
+    EventHub.publish = _publish_tap  # signature-preserving wrapper
+
+    if patch_show_overlay and callable(getattr(Overlay, "show_overlay", None)):
+        Overlay.show_overlay = _patched_show_overlay
+
+def launch():
+    """Run the real app (run.py) in this process, with the patches active."""
+    if not RUN.exists():
+        print("DIAG: ERROR -> ProjectRoot/run.py not found.")
+        sys.exit(1)
+    print("DIAG: launching real app via run.py ...")
+    run_as_main(RUN)
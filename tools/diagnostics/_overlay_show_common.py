@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+_overlay_show_common.py
+Shared Overlay.show() patch behind the 06_* launchers:
+- Registers live Overlay instances as they are constructed (live_overlays()).
+- install_show_patch(center) makes Overlay.show() run on the GUI (Graphical
+  User Interface) thread from any caller: it reapplies the HUD window flags,
+  positions the widget with center(w), shows it, then raises/activates it a
+  moment later, with DIAG logs at each step.
+"""
+import sys
+from pathlib import Path
+from weakref import WeakSet
+from PySide6.QtCore import Qt, QTimer, QMetaObject
+from _common import flags_to_str as _flags_to_str
+
+# ---- ensure src on sys.path ----
+HERE = Path(__file__).resolve()
+PROJECT_ROOT = HERE.parents[2]
+SRC = PROJECT_ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from KiCadPartsSyncer.ui.overlay import Overlay  # noqa: E402
+
+# ---- registry of live Overlay instances (filled at construction) ----
+_orig_show = Overlay.show
+_orig_init = Overlay.__init__
+_overlays = WeakSet()  # so the diag trays needn't scan top-level widgets
+
+def _patched_init(self, *args, **kwargs):
+    _orig_init(self, *args, **kwargs)
+    _overlays.add(self)
+
+Overlay.__init__ = _patched_init  # runtime patch
+
+def live_overlays():
+    """Snapshot of the Overlay instances that are still alive."""
+    return list(_overlays)
+
+# ---- Overlay.show patch ----
+# Two reused single-shot timers instead of two fresh singleShot()s per show.
+# Created on the GUI thread once QApplication exists (see ensure_timers()).
+_RAISE_DELAY_MS = 120
+_REQUIRED_FLAGS = Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
+_show_queue = {}   # overlays waiting to be shown (dict as an ordered set)
+_raise_queue = {}  # overlays waiting to be raised/activated
+_show_timer = None
+_raise_timer = None
+_center = None     # positioning callable passed to install_show_patch()
+
+def _reused_timer(ms, slot):
+    t = QTimer()
+    t.setSingleShot(True)
+    t.setInterval(ms)
+    t.timeout.connect(slot)
+    return t
+
+def ensure_timers():
+    """Create the show/raise timers; call on the GUI thread (e.g. from a QApplication.__init__ patch)."""
+    global _show_timer, _raise_timer
+    if _show_timer is None:
+        _show_timer = _reused_timer(0, _flush_show_queue)
+        _raise_timer = _reused_timer(_RAISE_DELAY_MS, _flush_raise_queue)
+
+def _apply_and_show(self):
+    # Only touch flags/attribute when missing: setWindowFlags recreates the native window
+    cur = self.windowFlags()
+    if (cur & _REQUIRED_FLAGS) != _REQUIRED_FLAGS:
+        self.setWindowFlags(cur | _REQUIRED_FLAGS)
+    if not self.testAttribute(Qt.WA_TranslucentBackground):
+        self.setAttribute(Qt.WA_TranslucentBackground, True)
+    _center(self)
+
+    print("DIAG: Overlay.show -> applying flags & centering, then QWidget.show()")
+    _orig_show(self)
+    _raise_queue[self] = None
+    _raise_timer.start()
+
+def _flush_show_queue():
+    pending = list(_show_queue); _show_queue.clear()
+    for w in pending:
+        _apply_and_show(w)
+
+def _flush_raise_queue():
+    pending = list(_raise_queue); _raise_queue.clear()
+    for w in pending:
+        w.raise_()
+        w.activateWindow()
+        print(f"DIAG: Overlay after show -> isVisible={w.isVisible()} "
+              f"geom={w.geometry().getRect()} flags={_flags_to_str(w.windowFlags())}")
+
+def _patched_show(self):
+    ensure_timers()
+    print(f"DIAG: Overlay.show intercepted -> isVisible={self.isVisible()} "
+          f"flags={_flags_to_str(self.windowFlags())}")
+    _show_queue[self] = None
+    # queued start() runs on the timer's (GUI) thread, whichever thread calls show()
+    QMetaObject.invokeMethod(_show_timer, "start", Qt.QueuedConnection)
+
+def install_show_patch(center):
+    """Patch Overlay.show(); center(w) positions the widget right before it is shown."""
+    global _center
+    _center = center
+    Overlay.show = _patched_show  # runtime patch